@@ -2,7 +2,11 @@
 SQL Server database connection endpoints.
 """
 from fastapi import APIRouter, HTTPException
+import asyncio
+import hashlib
+import time
 import uuid
+from typing import Any
 from app.core.config import settings
 from app.core.data_loader import HAS_SQL_SERVER_SUPPORT, register_data_source
 from app.models.schemas import (
@@ -15,19 +19,124 @@ from app.models.schemas import (
 # Optional SQL Server imports
 if HAS_SQL_SERVER_SUPPORT:
     import pyodbc
-    from sqlalchemy import create_engine, inspect, text
+    from sqlalchemy import create_engine, inspect
     from app.core.data_loader import SQLServerDataSource
 else:
     pyodbc = None
     create_engine = None
     inspect = None
-    text = None
     SQLServerDataSource = None
 
 
 router = APIRouter(prefix="/database", tags=["database"])
 
 
+# Engines are expensive to create (fresh pool + login handshake per request),
+# so cache one per (server, database, auth) and let the pool reuse connections.
+_ENGINE_CACHE: dict[tuple, Any] = {}
+_ENGINE_LOCK = asyncio.Lock()
+
+# Schema metadata rarely changes between requests, so serve repeat lookups
+# from a short-lived in-process cache instead of re-querying
+# INFORMATION_SCHEMA on every call.
+_META_CACHE: dict[tuple, tuple[float, Any]] = {}
+_META_CACHE_MAX = 256
+_META_LOCKS: dict[tuple, asyncio.Lock] = {}
+
+# Bound in-flight SQL work to what the pool can actually serve
+_SQL_SEMAPHORE = asyncio.Semaphore(settings.SQL_MAX_CONCURRENT)
+
+
+async def _cached_metadata(key: tuple, loader) -> Any:
+    """Run a blocking metadata loader with a TTL cache and single-flight locking"""
+    hit = _META_CACHE.get(key)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+
+    # Per-key lock so concurrent misses for the same database coalesce
+    # into a single query instead of stampeding the server.
+    lock = _META_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        hit = _META_CACHE.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+
+        async with _SQL_SEMAPHORE:
+            value = await asyncio.to_thread(loader)
+
+        if len(_META_CACHE) >= _META_CACHE_MAX:
+            # Drop expired entries first, then the soonest-to-expire
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in _META_CACHE.items() if exp <= now]:
+                del _META_CACHE[stale]
+            if len(_META_CACHE) >= _META_CACHE_MAX:
+                del _META_CACHE[min(_META_CACHE, key=lambda k: _META_CACHE[k][0])]
+
+        _META_CACHE[key] = (time.monotonic() + settings.METADATA_CACHE_TTL, value)
+        return value
+
+
+def _credential_key(config: SQLConnectionConfig) -> tuple:
+    """
+    Identity of the credentials in a connection config, for use in cache
+    keys. The password contributes as a digest so cached engines and
+    metadata are never shared across different credentials, without
+    keeping the plaintext around in key tuples.
+    """
+    if config.use_windows_auth:
+        return ('windows',)
+    digest = hashlib.sha256((config.password or '').encode()).hexdigest()
+    return (config.username, digest)
+
+
+def _build_connection_string(config: SQLConnectionConfig) -> str:
+    """Build a SQLAlchemy connection string from a connection config"""
+    driver = settings.SQL_SERVER_DRIVER.replace(' ', '+')
+
+    if config.use_windows_auth:
+        return (
+            f"mssql+pyodbc://@{config.server}/{config.database}"
+            f"?driver={driver}"
+            f"&trusted_connection=yes"
+        )
+
+    return (
+        f"mssql+pyodbc://{config.username}:{config.password}"
+        f"@{config.server}/{config.database}"
+        f"?driver={driver}"
+    )
+
+
+async def _get_engine(config: SQLConnectionConfig):
+    """Get or create a pooled engine for the given connection config"""
+    # The credentials are part of the key: a config with the same user but
+    # a different password must not be handed the engine (and pooled
+    # logins) built for the old one.
+    key = (config.server, config.port, config.database,
+           *_credential_key(config))
+
+    engine = _ENGINE_CACHE.get(key)
+    if engine is not None:
+        return engine
+
+    async with _ENGINE_LOCK:
+        # Re-check after acquiring the lock so concurrent first hits
+        # don't each build an engine.
+        engine = _ENGINE_CACHE.get(key)
+        if engine is None:
+            engine = create_engine(
+                _build_connection_string(config),
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                connect_args={'timeout': settings.SQL_CONNECTION_TIMEOUT}
+            )
+            _ENGINE_CACHE[key] = engine
+
+    return engine
+
+
 @router.post("/connect", response_model=SQLConnectionResponse)
 async def connect_to_sql_server(config: SQLConnectionConfig):
     """
@@ -45,50 +154,28 @@ async def connect_to_sql_server(config: SQLConnectionConfig):
             detail="SQL Server support not available. Install pyodbc and sqlalchemy: pip install pyodbc sqlalchemy"
         )
 
-    try:
-        # Build connection string for testing
-        if config.use_windows_auth:
-            conn_str = (
-                f"DRIVER={{{settings.SQL_SERVER_DRIVER}}};"
-                f"SERVER={config.server},{config.port};"
-                f"DATABASE={config.database};"
-                f"Trusted_Connection=yes;"
-            )
-            sqlalchemy_conn_str = (
-                f"mssql+pyodbc://@{config.server}/{config.database}"
-                f"?driver={settings.SQL_SERVER_DRIVER.replace(' ', '+')}"
-                f"&trusted_connection=yes"
-            )
-        else:
-            if not config.username or not config.password:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Username and password required for SQL Server authentication"
-                )
-            conn_str = (
-                f"DRIVER={{{settings.SQL_SERVER_DRIVER}}};"
-                f"SERVER={config.server},{config.port};"
-                f"DATABASE={config.database};"
-                f"UID={config.username};"
-                f"PWD={config.password};"
-            )
-            sqlalchemy_conn_str = (
-                f"mssql+pyodbc://{config.username}:{config.password}"
-                f"@{config.server}/{config.database}"
-                f"?driver={settings.SQL_SERVER_DRIVER.replace(' ', '+')}"
-            )
+    if not config.use_windows_auth and (not config.username or not config.password):
+        raise HTTPException(
+            status_code=400,
+            detail="Username and password required for SQL Server authentication"
+        )
 
+    try:
         # Test connection and get tables
-        engine = create_engine(
-            sqlalchemy_conn_str,
-            connect_args={'timeout': settings.SQL_CONNECTION_TIMEOUT}
-        )
+        engine = await _get_engine(config)
+
+        # pyodbc is synchronous, so keep the blocking work off the event loop
+        def _list_tables() -> list[str]:
+            with engine.connect():
+                return inspect(engine).get_table_names()
 
-        with engine.connect() as conn:
-            inspector = inspect(engine)
-            tables = inspector.get_table_names()
+        # Deliberately uncached: the whole point of /connect is validating
+        # the supplied credentials against the server, so it must always
+        # hit the database rather than ride on an earlier caller's result.
+        async with _SQL_SEMAPHORE:
+            tables = await asyncio.to_thread(_list_tables)
 
-        source_id = str(uuid.uuid4())
+        source_id = uuid.uuid4().hex
 
         return SQLConnectionResponse(
             source_id=source_id,
@@ -128,36 +215,53 @@ async def get_table_schema(table_name: str, config: SQLConnectionConfig):
         )
 
     try:
-        # Create connection
-        if config.use_windows_auth:
-            sqlalchemy_conn_str = (
-                f"mssql+pyodbc://@{config.server}/{config.database}"
-                f"?driver={settings.SQL_SERVER_DRIVER.replace(' ', '+')}"
-                f"&trusted_connection=yes"
-            )
-        else:
-            sqlalchemy_conn_str = (
-                f"mssql+pyodbc://{config.username}:{config.password}"
-                f"@{config.server}/{config.database}"
-                f"?driver={settings.SQL_SERVER_DRIVER.replace(' ', '+')}"
-            )
+        engine = await _get_engine(config)
 
-        engine = create_engine(
-            sqlalchemy_conn_str,
-            connect_args={'timeout': settings.SQL_CONNECTION_TIMEOUT}
-        )
-
-        # Get table schema
-        inspector = inspect(engine)
-        columns_info = inspector.get_columns(table_name)
+        # pyodbc is synchronous, so keep the blocking work off the event loop.
+        # Column metadata and row count are batched into one round trip:
+        # both statements go out in a single execute and come back as
+        # consecutive result sets.
+        def _fetch_schema() -> tuple[list[dict], int]:
+            # Row count comes from partition metadata rather than a
+            # COUNT(*) scan: O(1) regardless of table size, at the cost of
+            # being approximate while writes are in flight - close enough
+            # for a schema overview.
+            #
+            # SQLAlchemy soft-closes its DBAPI cursor as soon as the first
+            # result set is exhausted, so the second set has to be read
+            # through a raw cursor that we control and advance ourselves.
+            batch = (
+                "SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE "
+                "FROM INFORMATION_SCHEMA.COLUMNS "
+                "WHERE TABLE_NAME = ? "
+                "ORDER BY ORDINAL_POSITION; "
+                "SELECT SUM(rows) FROM sys.partitions "
+                "WHERE object_id = OBJECT_ID(?) AND index_id IN (0, 1)"
+            )
+            with engine.connect() as conn:
+                cursor = conn.connection.cursor()
+                try:
+                    cursor.execute(batch, (table_name, table_name))
+                    cols = [
+                        {'name': r[0], 'type': r[1], 'nullable': r[2] == 'YES'}
+                        for r in cursor.fetchall()
+                    ]
+                    if not cols:
+                        raise ValueError(f"Table '{table_name}' not found")
+                    cursor.nextset()
+                    row = cursor.fetchone()
+                    return cols, int(row[0]) if row and row[0] is not None else 0
+                finally:
+                    cursor.close()
 
-        # Get row count
-        with engine.connect() as conn:
-            result = conn.execute(text(f"SELECT COUNT(*) as cnt FROM {table_name}"))
-            row_count = result.scalar()
+        # Keyed by credentials too: a cached schema must only be served to
+        # callers who could have fetched it themselves.
+        cache_key = ('schema', config.server, config.port, config.database,
+                     *_credential_key(config), table_name)
+        columns_info, row_count = await _cached_metadata(cache_key, _fetch_schema)
 
         # Create data source
-        source_id = str(uuid.uuid4())
+        source_id = uuid.uuid4().hex
         connection_dict = {
             'server': config.server,
             'database': config.database,
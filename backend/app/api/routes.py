@@ -1,8 +1,11 @@
 """
 Main API routes for data operations and chart generation.
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+import asyncio
 import uuid
+import orjson
+import pyarrow as pa
 from app.core.data_loader import get_data_source
 from app.core.chart_generator import ChartGenerator
 from app.core.data_analyzer import DataAnalyzer
@@ -37,25 +40,29 @@ async def query_data(request: DataQueryRequest):
         raise HTTPException(status_code=404, detail="Data source not found")
 
     try:
-        # Get filtered data
-        df = data_source.get_data(
-            filters=request.filters,
-            limit=request.limit,
-            offset=request.offset,
-            columns=request.columns
-        )
-
-        # Convert to records
-        data = df.to_dict('records')
+        def _query() -> bytes:
+            # Get filtered data plus the matching row count in one fetch
+            # (one SQL round trip for database-backed sources)
+            df, total_rows = data_source.get_data(
+                filters=request.filters,
+                limit=request.limit,
+                offset=request.offset,
+                columns=request.columns,
+                with_total=True
+            )
+
+            # Serialize through Arrow + orjson rather than to_dict('records')
+            # + pydantic, which boxes every cell into Python objects twice
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            return orjson.dumps({
+                "data": table.to_pylist(),
+                "total_rows": total_rows,
+                "returned_rows": df.shape[0]
+            })
 
-        # Get total row count (without filters for pagination)
-        total_rows = data_source.get_row_count()
+        payload = await asyncio.to_thread(_query)
 
-        return DataQueryResponse(
-            data=data,
-            total_rows=total_rows,
-            returned_rows=len(data)
-        )
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error querying data: {str(e)}")
@@ -77,8 +84,8 @@ async def get_columns(source_id: str):
         raise HTTPException(status_code=404, detail="Data source not found")
 
     try:
-        columns = data_source.get_columns()
-        data_types = data_source.get_data_types()
+        columns = await asyncio.to_thread(data_source.get_columns)
+        data_types = await asyncio.to_thread(data_source.get_data_types)
 
         return {
             "columns": columns,
@@ -105,9 +112,9 @@ async def get_data_summary(source_id: str):
         raise HTTPException(status_code=404, detail="Data source not found")
 
     try:
-        df = data_source.get_data()
+        df = await asyncio.to_thread(data_source.get_data)
 
-        stats = DataAnalyzer.get_summary_stats_list(df)
+        stats = await asyncio.to_thread(DataAnalyzer.get_summary_stats_list, df)
 
         return DataSummaryResponse(
             source_id=source_id,
@@ -138,13 +145,54 @@ async def get_filter_options(source_id: str, column: str, limit: int = 100):
         raise HTTPException(status_code=404, detail="Data source not found")
 
     try:
-        values = data_source.get_unique_values(column, limit)
+        values = await asyncio.to_thread(data_source.get_unique_values, column, limit)
         return {"column": column, "values": values}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting filter options: {str(e)}")
 
 
+def _filters_key(filters) -> tuple:
+    """Hashable key identifying a filter list, for sharing fetched data"""
+    return tuple(
+        (f.column, f.operator, repr(f.value), repr(f.value2))
+        for f in filters
+    )
+
+
+def _build_chart_payload(request: ChartRequest, df) -> bytes:
+    """
+    Generate a chart from already-fetched data, serialized to JSON bytes.
+
+    Plotly figures are large nested dicts with numpy arrays inside; letting
+    pydantic re-encode them recursively dominates chart response time, so
+    the generator serializes the figure once with orjson (which handles
+    numpy natively) and the cached bytes are spliced into the envelope
+    as a Fragment, without re-encoding.
+    """
+    if df.empty:
+        raise HTTPException(status_code=400, detail="No data available after filtering")
+
+    figure_json = ChartGenerator.generate_chart_json(
+        chart_type=request.chart_type,
+        data=df,
+        x=request.x_column,
+        y=request.y_column,
+        color=request.color_column,
+        size=request.size_column,
+        title=request.title,
+        x_label=request.x_label,
+        y_label=request.y_label,
+        **request.options
+    )
+
+    return orjson.dumps({
+        "chart_id": uuid.uuid4().hex,
+        "chart_type": request.chart_type.value,
+        "figure": orjson.Fragment(figure_json)
+    })
+
+
 @router.post("/charts/generate", response_model=ChartResponse)
 async def generate_chart(request: ChartRequest):
     """
@@ -162,33 +210,14 @@ async def generate_chart(request: ChartRequest):
 
     try:
         # Get filtered data
-        df = data_source.get_data(filters=request.filters)
-
-        if df.empty:
-            raise HTTPException(status_code=400, detail="No data available after filtering")
-
-        # Generate chart
-        figure = ChartGenerator.generate_chart(
-            chart_type=request.chart_type,
-            data=df,
-            x=request.x_column,
-            y=request.y_column,
-            color=request.color_column,
-            size=request.size_column,
-            title=request.title,
-            x_label=request.x_label,
-            y_label=request.y_label,
-            **request.options
-        )
+        df = await asyncio.to_thread(data_source.get_data, filters=request.filters)
 
-        chart_id = str(uuid.uuid4())
+        payload = await asyncio.to_thread(_build_chart_payload, request, df)
 
-        return ChartResponse(
-            chart_id=chart_id,
-            chart_type=request.chart_type.value,
-            figure=figure
-        )
+        return Response(content=payload, media_type="application/json")
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating chart: {str(e)}")
 
@@ -204,19 +233,48 @@ async def generate_charts_batch(requests: list[ChartRequest]):
     Returns:
         List of chart responses
     """
-    responses = []
-
+    # Dashboards often request several charts over the same data; fetch
+    # each unique (source, filters) combination once, concurrently, and
+    # share the DataFrame across the charts that use it.
+    unique_requests: dict[tuple, ChartRequest] = {}
     for request in requests:
+        key = (request.source_id, _filters_key(request.filters))
+        unique_requests.setdefault(key, request)
+
+    async def _fetch(request: ChartRequest):
+        data_source = get_data_source(request.source_id)
+        if not data_source:
+            return HTTPException(status_code=404, detail="Data source not found")
         try:
-            response = await generate_chart(request)
-            responses.append(response)
-        except HTTPException as e:
-            responses.append({
-                "error": e.detail,
-                "chart_type": request.chart_type.value
-            })
+            return await asyncio.to_thread(data_source.get_data, filters=request.filters)
+        except Exception as e:
+            return HTTPException(status_code=500, detail=f"Error querying data: {str(e)}")
+
+    fetched = await asyncio.gather(*(_fetch(r) for r in unique_requests.values()))
+    frames = dict(zip(unique_requests.keys(), fetched))
+
+    async def _render(request: ChartRequest):
+        result = frames[(request.source_id, _filters_key(request.filters))]
+        if not isinstance(result, HTTPException):
+            try:
+                return await asyncio.to_thread(_build_chart_payload, request, result)
+            except HTTPException as e:
+                result = e
+            except Exception as e:
+                result = HTTPException(status_code=500, detail=f"Error generating chart: {str(e)}")
+        return {
+            "error": result.detail,
+            "chart_type": request.chart_type.value
+        }
+
+    results = await asyncio.gather(*(_render(r) for r in requests))
 
-    return responses
+    # Each chart is already JSON bytes; splice them into the list with
+    # orjson.Fragment instead of re-parsing and re-encoding
+    payload = orjson.dumps(
+        [orjson.Fragment(r) if isinstance(r, bytes) else r for r in results]
+    )
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/analysis/suggestions/{source_id}", response_model=ChartSuggestionsResponse)
@@ -236,9 +294,9 @@ async def get_chart_suggestions(source_id: str, max_suggestions: int = 10):
         raise HTTPException(status_code=404, detail="Data source not found")
 
     try:
-        df = data_source.get_data()
+        df = await asyncio.to_thread(data_source.get_data)
 
-        suggestions = DataAnalyzer.suggest_chart_types(df, max_suggestions)
+        suggestions = await asyncio.to_thread(DataAnalyzer.suggest_chart_types, df, max_suggestions)
 
         return ChartSuggestionsResponse(
             source_id=source_id,
@@ -265,9 +323,10 @@ async def detect_outliers(request: OutlierDetectionRequest):
         raise HTTPException(status_code=404, detail="Data source not found")
 
     try:
-        df = data_source.get_data()
+        df = await asyncio.to_thread(data_source.get_data)
 
-        outlier_indices, outlier_values = DataAnalyzer.detect_outliers(
+        outlier_indices, outlier_values = await asyncio.to_thread(
+            DataAnalyzer.detect_outliers,
             df,
             request.column,
             request.method,
@@ -302,9 +361,9 @@ async def get_correlation(source_id: str):
         raise HTTPException(status_code=404, detail="Data source not found")
 
     try:
-        df = data_source.get_data()
+        df = await asyncio.to_thread(data_source.get_data)
 
-        corr_matrix = DataAnalyzer.get_correlation_matrix(df)
+        corr_matrix = await asyncio.to_thread(DataAnalyzer.get_correlation_matrix, df)
 
         return {
             "correlation_matrix": corr_matrix.to_dict(),
@@ -3,15 +3,109 @@ CSV file upload endpoints.
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from pathlib import Path
+import asyncio
+import hashlib
+import os
 import uuid
 import aiofiles
+import pyarrow.csv as pacsv
 from app.core.config import settings
-from app.core.data_loader import CSVDataSource, register_data_source
-from app.models.schemas import CSVUploadResponse
+from app.core.data_loader import CSVDataSource, register_data_source, get_data_source
+from app.models.schemas import CSVUploadResponse, ColumnInfo
 
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+
+# Content hash -> source_id of already-uploaded files, so re-uploading the
+# same CSV reuses the existing source (and its parsed DataFrame) instead of
+# storing and parsing a duplicate
+_HASH_TO_SOURCE: dict[str, str] = {}
+
+# Limit simultaneous uploads; each one costs disk bandwidth and a preview
+# parse, and unbounded concurrency just thrashes
+_UPLOAD_SEMAPHORE = asyncio.Semaphore(settings.MAX_CONCURRENT_UPLOADS)
+
+
+def _persist_spooled_upload(src, file_path: Path) -> tuple[int, str]:
+    """
+    Persist an upload that Starlette already spooled to disk.
+
+    The spooled temp file has a real file descriptor, so the bytes can be
+    moved kernel-to-kernel with os.sendfile instead of being copied
+    through Python userspace; only the hashing pass reads them.
+    """
+    src_fd = src.fileno()
+    size = os.fstat(src_fd).st_size
+    if size > settings.MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
+        )
+
+    hasher = hashlib.sha256()
+    src.seek(0)
+    while chunk := src.read(UPLOAD_CHUNK_SIZE):
+        hasher.update(chunk)
+
+    dst_fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    finally:
+        os.close(dst_fd)
+
+    return size, hasher.hexdigest()
+
+
+def _preview_csv(file_path: Path) -> tuple[list[ColumnInfo], list[dict], int]:
+    """
+    Build column info, a preview and the row count from one streaming pass.
+
+    Only the first batch is kept; the rest of the file is drained batch by
+    batch just to sum row counts, so the count honors the CSV grammar
+    (quoted embedded newlines included) without ever materializing the
+    whole file. The full pandas parse is still deferred until the data is
+    actually queried.
+    """
+    reader = pacsv.open_csv(
+        file_path,
+        read_options=pacsv.ReadOptions(block_size=UPLOAD_CHUNK_SIZE)
+    )
+    first_batch = None
+    total_rows = 0
+    try:
+        while True:
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                break
+            if first_batch is None:
+                first_batch = batch
+            total_rows += batch.num_rows
+    finally:
+        reader.close()
+
+    columns = []
+    preview = []
+    if first_batch is not None:
+        for field, column in zip(first_batch.schema, first_batch.columns):
+            columns.append(ColumnInfo(
+                name=field.name,
+                dtype=str(field.type),
+                nullable=column.null_count > 0
+            ))
+        # Slice in Arrow (zero-copy) before converting, so only the 100
+        # preview rows are ever boxed into Python objects
+        preview = first_batch.slice(0, 100).to_pylist()
+
+    return columns, preview, total_rows
+
 
 @router.post("", response_model=CSVUploadResponse)
 async def upload_csv(file: UploadFile = File(...)):
@@ -32,48 +126,90 @@ async def upload_csv(file: UploadFile = File(...)):
         )
 
     # Generate unique source ID and filename
-    source_id = str(uuid.uuid4())
+    source_id = uuid.uuid4().hex
     safe_filename = f"{source_id}_{file.filename}"
     file_path = settings.UPLOAD_DIR / safe_filename
 
-    try:
-        # Save uploaded file
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            if len(content) > settings.MAX_UPLOAD_SIZE:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
-                )
-            await f.write(content)
+    # Bound concurrent uploads so N simultaneous clients cannot hold
+    # N x chunk buffers and parse jobs at once
+    async with _UPLOAD_SEMAPHORE:
+        try:
+            # Large uploads have already been spooled to disk by Starlette;
+            # move those with sendfile (zero-copy) instead of pumping the
+            # bytes through Python. Small in-memory uploads keep the
+            # chunked write path.
+            use_sendfile = getattr(file.file, '_rolled', False) and hasattr(os, 'sendfile')
+            if use_sendfile:
+                try:
+                    total_bytes, digest = await asyncio.to_thread(
+                        _persist_spooled_upload, file.file, file_path
+                    )
+                except OSError:
+                    # e.g. filesystem without sendfile support. The hashing
+                    # pass left the spooled file at EOF and sendfile may
+                    # have written part of the destination - rewind the
+                    # source and drop the partial file so the fallback
+                    # starts clean instead of persisting zero bytes.
+                    use_sendfile = False
+                    await file.seek(0)
+                    if file_path.exists():
+                        file_path.unlink()
 
-        # Create data source
-        data_source = CSVDataSource(source_id, file_path)
-        register_data_source(data_source)
+            if not use_sendfile:
+                # Save uploaded file, streaming in chunks so a large upload
+                # never has to fit in memory and oversized files are rejected
+                # early. Hash the stream as it passes through; hashing is
+                # negligible next to the disk writes.
+                total_bytes = 0
+                hasher = hashlib.sha256()
+                async with aiofiles.open(file_path, 'wb') as f:
+                    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                        total_bytes += len(chunk)
+                        if total_bytes > settings.MAX_UPLOAD_SIZE:
+                            raise HTTPException(
+                                status_code=400,
+                                detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
+                            )
+                        hasher.update(chunk)
+                        await f.write(chunk)
+                digest = hasher.hexdigest()
 
-        # Load data to get info
-        df = data_source.load_data()
+            # Identical content already registered? Reuse that source instead
+            # of keeping a duplicate file and re-parsing it later.
+            existing_id = _HASH_TO_SOURCE.get(digest)
+            existing = get_data_source(existing_id) if existing_id else None
+            if existing is not None:
+                file_path.unlink()
+                columns, preview, rows = await asyncio.to_thread(_preview_csv, existing.file_path)
+                return CSVUploadResponse(
+                    source_id=existing_id,
+                    filename=file.filename,
+                    rows=rows,
+                    columns=columns,
+                    preview=preview
+                )
 
-        # Get column information
-        columns = data_source.get_columns()
+            # Create data source; the full parse happens lazily on first query
+            data_source = CSVDataSource(source_id, file_path)
+            register_data_source(data_source)
+            _HASH_TO_SOURCE[digest] = source_id
 
-        # Get preview (first 100 rows)
-        preview_df = df.head(100)
-        preview = preview_df.to_dict('records')
+            # Column info, preview and row count come from the first CSV block
+            columns, preview, rows = await asyncio.to_thread(_preview_csv, file_path)
 
-        return CSVUploadResponse(
-            source_id=source_id,
-            filename=file.filename,
-            rows=len(df),
-            columns=columns,
-            preview=preview
-        )
+            return CSVUploadResponse(
+                source_id=source_id,
+                filename=file.filename,
+                rows=rows,
+                columns=columns,
+                preview=preview
+            )
 
-    except Exception as e:
-        # Clean up file if something went wrong
-        import traceback
-        error_traceback = traceback.format_exc()
-        print(f"ERROR uploading file: {error_traceback}")
-        if file_path.exists():
-            file_path.unlink()
-        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+        except Exception as e:
+            # Clean up file if something went wrong
+            import traceback
+            error_traceback = traceback.format_exc()
+            print(f"ERROR uploading file: {error_traceback}")
+            if file_path.exists():
+                file_path.unlink()
+            raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
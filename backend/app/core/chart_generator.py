@@ -1,12 +1,402 @@
 """
 Chart generation using Plotly Graph Objects.
 """
-import plotly.graph_objects as go
-import plotly.express as px
+import copy
+import hashlib
+from functools import cache, lru_cache
+import orjson
 import pandas as pd
 import numpy as np
 from typing import Optional, Any
 from app.models.schemas import ChartType
+from app.core.data_analyzer import DataAnalyzer
+
+
+@cache
+def _go():
+    """
+    Import plotly.graph_objects on first use.
+
+    The import builds Plotly's full class hierarchy and takes a sizeable
+    chunk of interpreter startup; it is only needed for the validated
+    debug path (see RAW), so normal operation never pays for it.
+    """
+    import plotly.graph_objects as go
+    return go
+
+
+@cache
+def _scipy_stats():
+    """
+    Import scipy.stats on first use.
+
+    Histogram fit overlays and summary statistics are the only scipy
+    consumers; importing here keeps startup lean while repeat calls pay
+    one cached-function lookup instead of re-running the import
+    statement's module resolution each time.
+    """
+    from scipy import stats
+    return stats
+
+
+def _figure_json_default(obj):
+    """Handle what orjson cannot serialize natively: object-dtype numpy
+    arrays (e.g. string columns) fall back to a plain list"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Figures are assembled as plain dicts in plotly.js shape, skipping
+# graph_objects' per-property validation entirely (see _figure). Flip off
+# to round-trip every figure through Plotly's validators when debugging.
+RAW = True
+
+
+def _build_layout(title: Optional[str], xaxis_title: Optional[str],
+                  yaxis_title: Optional[str], extra_items) -> dict:
+    """Build a plotly.js-shaped layout dict (nested titles, no magic
+    underscores); axis entries in extras merge with the axis titles"""
+    layout = {'title': {'text': title}}
+    if xaxis_title is not None:
+        layout['xaxis'] = {'title': {'text': xaxis_title}}
+    if yaxis_title is not None:
+        layout['yaxis'] = {'title': {'text': yaxis_title}}
+    for key, value in extra_items:
+        if value is None:
+            continue
+        if key in ('xaxis', 'yaxis') and key in layout:
+            layout[key] = {**layout[key], **value}
+        else:
+            layout[key] = value
+    return layout
+
+
+@lru_cache(maxsize=256)
+def _layout_template(title: Optional[str], xaxis_title: Optional[str],
+                     yaxis_title: Optional[str], extra: tuple) -> dict:
+    """Build the layout for a (title, axes, options) combination once"""
+    return _build_layout(title, xaxis_title, yaxis_title, extra)
+
+
+def _layout(title: Optional[str], xaxis_title: Optional[str] = None,
+            yaxis_title: Optional[str] = None, **extra) -> dict:
+    """
+    Assemble a figure layout, serving repeats from a template cache.
+
+    Layouts depend only on titles/labels/options, not on the data, so
+    dashboards that re-render the same chart shapes skip rebuilding them.
+    Unhashable extras (nested axis/legend dicts) fall back to direct
+    construction.
+    """
+    try:
+        template = _layout_template(
+            title, xaxis_title, yaxis_title, tuple(sorted(extra.items()))
+        )
+    except TypeError:
+        return _build_layout(title, xaxis_title, yaxis_title, extra.items())
+    # Clone so callers can safely tweak their copy
+    return copy.deepcopy(template)
+
+
+# Line/time-series traces longer than this are downsampled before they
+# are handed to Plotly
+_DOWNSAMPLE_THRESHOLD = 5000
+_DOWNSAMPLE_POINTS = 2000
+
+# Scatter traces are capped at this many points; beyond it the extra
+# markers only overdraw pixels while serialization cost keeps growing
+_SCATTER_MAX_POINTS = 50000
+
+
+def _sample_positions(n: int, max_pts: int) -> Optional[np.ndarray]:
+    """
+    Sorted positions of a uniform random sample, or None when the data
+    already fits.
+
+    Seeded so repeat requests over the same data produce identical
+    figures (and stay cacheable); sorted so sampled traces keep the
+    original row order.
+    """
+    if n <= max_pts:
+        return None
+    positions = np.random.default_rng(42).choice(n, size=max_pts, replace=False)
+    positions.sort()
+    return positions
+
+# Trendline equation term templates for powers 0 and 1; higher powers
+# are formatted inline with their exponent
+_TERM_FMT = ("{:.2f}", "{:.2f}x")
+
+
+@lru_cache(maxsize=1024)
+def _scatter_hover_template(x: str, y: str, color: Optional[str],
+                            size: Optional[str]) -> str:
+    """Hover template for scatter traces, cached per label combination;
+    pass color/size as None when the trace will not carry that field"""
+    template = f"<b>{x}</b>: %{{x}}<br><b>{y}</b>: %{{y}}"
+    if color:
+        template += f"<br><b>{color}</b>: %{{text}}"
+    if size:
+        template += f"<br><b>{size}</b>: %{{marker.size}}"
+    return template
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of the n_out points that best preserve the visual
+    shape of the series: first and last point always survive, and each
+    bucket keeps the point forming the largest triangle with the
+    previously kept point and the next bucket's average.
+    """
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    out = np.empty(n_out, dtype=np.intp)
+    out[0] = 0
+    out[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if hi <= lo:
+            hi = lo + 1
+        if i < n_out - 3:
+            nlo, nhi = edges[i + 1], edges[i + 2]
+            avg_x = x[nlo:max(nhi, nlo + 1)].mean()
+            avg_y = y[nlo:max(nhi, nlo + 1)].mean()
+        else:
+            avg_x = x[-1]
+            avg_y = y[-1]
+        # Triangle area against the anchor point and next bucket average,
+        # computed for the whole bucket at once
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+
+    return out
+
+
+def _trend_fused(x: np.ndarray, y: np.ndarray, coeffs: np.ndarray) -> tuple:
+    """
+    Residual and total sum of squares for a polynomial fit.
+
+    Horner evaluation plus both sums in one routine, so the R² for a
+    trendline costs a single sweep over x/y instead of a polyval pass
+    followed by separate residual and variance passes.
+    """
+    pred = np.full(x.size, coeffs[0])
+    for k in range(1, coeffs.size):
+        pred = pred * x + coeffs[k]
+    resid = y - pred
+    sy = y.sum()
+    ss_res = float((resid * resid).sum())
+    ss_tot = float((y * y).sum() - sy * sy / y.size)
+    return ss_res, ss_tot
+
+
+# Optional Numba acceleration (same pattern as data_analyzer): the LTTB
+# bucket loop is the one genuinely Python-level hot loop here, and JIT
+# compilation removes its interpreter overhead and fuses the trendline
+# sums into one pass. The histogram/bincount helpers already spend their
+# time inside numpy's C kernels.
+try:
+    from numba import njit
+    _lttb_indices = njit(cache=True, fastmath=True)(_lttb_indices)
+    _trend_fused = njit(cache=True, fastmath=True)(_trend_fused)
+except ImportError:
+    pass
+
+
+def _maybe_downsample(x_arr: np.ndarray, y_arr: np.ndarray) -> tuple:
+    """
+    Downsample a long line trace with LTTB.
+
+    Returns (x, y, original_length); series at or below the threshold, or
+    with non-numeric values, come back untouched.
+    """
+    n = len(y_arr)
+    if n <= _DOWNSAMPLE_THRESHOLD:
+        return x_arr, y_arr, n
+
+    if np.issubdtype(x_arr.dtype, np.datetime64):
+        x_num = x_arr.astype('datetime64[ns]').astype(np.float64)
+    else:
+        try:
+            x_num = x_arr.astype(np.float64)
+        except (TypeError, ValueError):
+            # Non-numeric x: bucket by position
+            x_num = np.arange(n, dtype=np.float64)
+    try:
+        y_num = y_arr.astype(np.float64)
+    except (TypeError, ValueError):
+        return x_arr, y_arr, n
+
+    idx = _lttb_indices(x_num, y_num, _DOWNSAMPLE_POINTS)
+    return x_arr[idx], y_arr[idx], n
+
+
+def _prebinned_hist(values: np.ndarray, bins, density: bool = False):
+    """
+    Bin values server-side for a go.Bar histogram.
+
+    go.Histogram ships every raw sample to the browser and re-bins it in
+    Plotly.js; binning here shrinks the payload from N samples to `bins`
+    counts. Returns (centers, counts, widths); `bins` may be a count or
+    precomputed edges (so grouped overlays share the same bins).
+    """
+    counts, edges = np.histogram(values, bins=bins, density=density)
+    centers = (edges[:-1] + edges[1:]) / 2
+    return centers, counts, np.diff(edges)
+
+
+_HIST_STATS_CACHE: dict[bytes, tuple] = {}
+_HIST_STATS_CACHE_MAX = 256
+
+
+def _hist_stats(arr: np.ndarray) -> tuple:
+    """
+    Summary statistics for a histogram column:
+    (n, mean, std, median, skewness, kurtosis, shapiro_p).
+
+    Everything here is a deterministic pure function of the array (the
+    Shapiro sample is seeded), so results are memoized by content hash:
+    dashboards re-rendering the same histogram with different titles or
+    layout options skip the scipy work, and the single hashing pass is
+    far cheaper than skew/kurtosis/Shapiro.
+    """
+    key = hashlib.blake2b(arr.tobytes(), digest_size=16).digest()
+    cached = _HIST_STATS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    scipy_stats = _scipy_stats()
+
+    n = arr.size
+    mean_val = float(arr.mean())
+    std_val = float(arr.std(ddof=1))
+    median_val = float(np.median(arr))
+    # bias=False matches pandas' adjusted skew/kurtosis estimators
+    skewness = float(scipy_stats.skew(arr, bias=False))
+    kurtosis = float(scipy_stats.kurtosis(arr, bias=False))
+
+    # Shapiro-Wilk test (limit sample size for performance); sample the
+    # ndarray directly instead of going through Series.sample's index
+    # machinery
+    sample = arr if n <= 5000 else np.random.default_rng(42).choice(arr, size=5000, replace=False)
+    try:
+        _, shapiro_p = scipy_stats.shapiro(sample)
+    except Exception:
+        shapiro_p = None
+
+    stats = (n, mean_val, std_val, median_val, skewness, kurtosis, shapiro_p)
+    if len(_HIST_STATS_CACHE) >= _HIST_STATS_CACHE_MAX:
+        _HIST_STATS_CACHE.pop(next(iter(_HIST_STATS_CACHE)))
+    _HIST_STATS_CACHE[key] = stats
+    return stats
+
+
+def _with_categorical_grouper(data: pd.DataFrame, key: str) -> pd.DataFrame:
+    """
+    Convert a string grouper column to Categorical before groupby.
+
+    Grouping on raw strings hashes every element each time; Categorical
+    hashes each distinct value once and groupby(observed=True) then works
+    on small integer codes.
+    """
+    dtype = data[key].dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return data
+    if dtype == object or pd.api.types.is_string_dtype(dtype):
+        return data.assign(**{key: data[key].astype('category')})
+    return data
+
+
+def _group_positions(values: pd.Series) -> list:
+    """
+    Partition row positions by group label.
+
+    One stable argsort over categorical codes replaces pandas' per-group
+    sub-DataFrame materialization: each group becomes a position array
+    for direct ndarray indexing. NaN labels are dropped, matching
+    groupby's default, and groups come back in category (sorted) order.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        cat = values.array
+    else:
+        cat = pd.Categorical(values)
+    codes = np.asarray(cat.codes)
+    order = np.argsort(codes, kind='stable')
+    # Missing values encode as -1 and sort first
+    order = order[np.searchsorted(codes[order], 0):]
+    splits = np.searchsorted(codes[order], np.arange(len(cat.categories) + 1))
+    return [
+        (cat.categories[i], order[splits[i]:splits[i + 1]])
+        for i in range(len(cat.categories))
+        if splits[i] < splits[i + 1]
+    ]
+
+
+def _as_np(values, dtype=None) -> np.ndarray:
+    """
+    Return a contiguous ndarray view of a Series/Index/array-like.
+
+    Handing Plotly ndarrays instead of pandas objects lets its typed-array
+    encoder ship numeric data as base64 (plotly >= 5.24) rather than
+    element-by-element JSON, and skips the hidden np.asarray conversion it
+    would otherwise do per trace. copy=False reuses the column's backing
+    buffer when the dtype already matches, so no bytes move at all; pass
+    `dtype` to coerce (e.g. 'datetime64[ns]' for date axes).
+    """
+    if hasattr(values, 'to_numpy'):
+        arr = values.to_numpy(dtype=dtype, copy=False)
+    else:
+        arr = np.asarray(values, dtype=dtype)
+    return np.ascontiguousarray(arr)
+
+
+def _dates(data: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Return a column as a datetime64[ns] ndarray.
+
+    Object/string date columns are converted once up front (cache=True
+    dedupes repeated date strings); otherwise Plotly parses each element
+    on its own. Already-datetime columns pass through without a copy.
+    """
+    col = data[column]
+    if pd.api.types.is_datetime64_any_dtype(col.dtype):
+        return _as_np(col)
+    return pd.to_datetime(col, cache=True, errors='coerce').to_numpy()
+
+
+@cache
+def _plotly_template() -> dict:
+    """Expanded 'plotly_white' template, as fig.to_dict() would embed it"""
+    import plotly.io as pio
+    return pio.templates['plotly_white'].to_plotly_json()
+
+
+def _figure(traces: list[dict], layout: dict) -> dict:
+    """
+    Assemble a figure dict directly, skipping go.Figure.
+
+    Every trace constructor and the final fig.to_dict() run the whole
+    structure through Plotly's validator machinery plus a deep copy,
+    which dominates figure build time. The traces and layout here must
+    already be in plotly.js shape (nested titles, no magic underscores);
+    the template is embedded the same way fig.to_dict() would. With RAW
+    off, _create_chart round-trips the result through go.Figure so the
+    validators still check it.
+    """
+    layout.setdefault('template', _plotly_template())
+    return {'data': traces, 'layout': layout}
 
 
 class ChartGenerator:
@@ -22,69 +412,83 @@ class ChartGenerator:
                          secondary_y_columns: Optional[list[str]] = None,
                          **options) -> dict:
         """Create a line chart with optional multi-Y columns and secondary axis"""
-        fig = go.Figure()
-
         # Determine which columns to plot
+        cols = frozenset(data.columns)
         columns_to_plot = y_columns if y_columns else [y]
         secondary_cols = set(secondary_y_columns or [])
         has_secondary = len(secondary_cols) > 0
-
-        if color and color in data.columns:
-            # Grouped by color — use first Y column only to avoid trace explosion
+        downsampled_from = 0
+        traces = []
+
+        if color and color in cols:
+            # Grouped by color — use first Y column only to avoid trace explosion.
+            # _group_positions partitions in one pass instead of re-scanning
+            # the frame with a boolean mask per group, and indexing the
+            # shared ndarrays skips per-group frame materialization.
             plot_y = columns_to_plot[0]
-            for group_name in data[color].unique():
-                group_data = data[data[color] == group_name]
-                fig.add_trace(go.Scatter(
-                    x=group_data[x],
-                    y=group_data[plot_y],
-                    mode='lines+markers',
-                    name=str(group_name),
-                    line=dict(width=2),
-                    marker=dict(size=6)
-                ))
+            x_arr, y_arr = _as_np(data[x]), _as_np(data[plot_y])
+            for group_name, idx in _group_positions(data[color]):
+                xs, ys, source_points = _maybe_downsample(x_arr[idx], y_arr[idx])
+                if len(ys) < source_points:
+                    downsampled_from = max(downsampled_from, source_points)
+                traces.append({
+                    'type': 'scatter',
+                    'x': xs,
+                    'y': ys,
+                    'mode': 'lines+markers',
+                    'name': str(group_name),
+                    'line': {'width': 2},
+                    'marker': {'size': 6}
+                })
         else:
             # Multiple Y columns
             for col in columns_to_plot:
-                if col not in data.columns:
+                if col not in cols:
                     continue
-                trace_kwargs = dict(
-                    x=data[x],
-                    y=data[col],
-                    mode='lines+markers',
-                    name=col,
-                    line=dict(width=2),
-                    marker=dict(size=6)
+                xs, ys, source_points = _maybe_downsample(
+                    _as_np(data[x]), _as_np(data[col])
                 )
+                if len(ys) < source_points:
+                    downsampled_from = max(downsampled_from, source_points)
+                trace = {
+                    'type': 'scatter',
+                    'x': xs,
+                    'y': ys,
+                    'mode': 'lines+markers',
+                    'name': col,
+                    'line': {'width': 2},
+                    'marker': {'size': 6}
+                }
                 if has_secondary and col in secondary_cols:
-                    trace_kwargs['yaxis'] = 'y2'
-                fig.add_trace(go.Scatter(**trace_kwargs))
+                    trace['yaxis'] = 'y2'
+                traces.append(trace)
 
         # Build layout
-        layout = dict(
-            title=title or f"{', '.join(columns_to_plot)} vs {x}",
+        layout = _layout(
+            title or f"{', '.join(columns_to_plot)} vs {x}",
             xaxis_title=x_label or x,
-            hovermode='closest',
-            template='plotly_white'
+            hovermode='closest'
         )
 
         if has_secondary:
             primary_cols = [c for c in columns_to_plot if c not in secondary_cols]
-            layout['yaxis'] = dict(
-                title=y_label or (', '.join(primary_cols) if primary_cols else 'Primary'),
-                side='left'
-            )
-            layout['yaxis2'] = dict(
-                title=', '.join(secondary_cols),
-                side='right',
-                overlaying='y',
-                showgrid=False
-            )
+            layout['yaxis'] = {
+                'title': {'text': y_label or (', '.join(primary_cols) if primary_cols else 'Primary')},
+                'side': 'left'
+            }
+            layout['yaxis2'] = {
+                'title': {'text': ', '.join(secondary_cols)},
+                'side': 'right',
+                'overlaying': 'y',
+                'showgrid': False
+            }
         else:
-            layout['yaxis_title'] = y_label or (columns_to_plot[0] if len(columns_to_plot) == 1 else "Value")
+            layout['yaxis'] = {'title': {'text': y_label or (columns_to_plot[0] if len(columns_to_plot) == 1 else "Value")}}
 
-        fig.update_layout(**layout)
+        if downsampled_from:
+            layout['meta'] = {'downsampled_from': downsampled_from}
 
-        return fig.to_dict()
+        return _figure(traces, layout)
 
     @staticmethod
     def create_bar_chart(data: pd.DataFrame, x: str, y: Optional[str] = None,
@@ -97,67 +501,70 @@ class ChartGenerator:
                         sort_order: str = '',
                         **options) -> dict:
         """Create a bar chart with stacked/grouped mode and sorting"""
-        fig = go.Figure()
+        cols = frozenset(data.columns)
 
-        # Apply sorting
-        plot_data = data.copy()
-        if sort_order and y and y in plot_data.columns and x in plot_data.columns:
+        # Apply sorting; sort_values already returns a new frame, so the
+        # unsorted path can use the original without copying it
+        plot_data = data
+        if sort_order and y and y in cols and x in cols:
             if sort_order == 'asc':
-                plot_data = plot_data.sort_values(by=y, ascending=True)
+                plot_data = plot_data.sort_values(by=y, ascending=True, kind='stable')
             elif sort_order == 'desc':
-                plot_data = plot_data.sort_values(by=y, ascending=False)
+                plot_data = plot_data.sort_values(by=y, ascending=False, kind='stable')
             elif sort_order == 'alpha':
-                plot_data = plot_data.sort_values(by=x, ascending=True)
+                plot_data = plot_data.sort_values(by=x, ascending=True, kind='stable')
 
+        traces = []
         if y is None:
-            # Count frequency
-            counts = plot_data[x].value_counts()
+            # Count frequency through categorical codes + bincount: one
+            # linear pass instead of value_counts' hash-and-sort
+            col = plot_data[x]
+            if not isinstance(col.dtype, pd.CategoricalDtype):
+                col = col.astype('category')
+            codes = col.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(col.cat.categories))
+            labels = _as_np(col.cat.categories)
+
+            # Categories are already sorted, so 'alpha' and the default
+            # label order need no extra work
             if sort_order == 'asc':
-                counts = counts.sort_values(ascending=True)
+                order = np.argsort(counts, kind='stable')
+                labels, counts = labels[order], counts[order]
             elif sort_order == 'desc':
-                counts = counts.sort_values(ascending=False)
-            elif sort_order == 'alpha':
-                counts = counts.sort_index(ascending=True)
-            else:
-                counts = counts.sort_index()
+                order = np.argsort(-counts, kind='stable')
+                labels, counts = labels[order], counts[order]
 
             if orientation == 'v':
-                fig.add_trace(go.Bar(x=counts.index, y=counts.values))
-            else:
-                fig.add_trace(go.Bar(y=counts.index, x=counts.values, orientation='h'))
-        else:
-            # Use y values
-            if color and color in plot_data.columns:
-                for group_name in plot_data[color].unique():
-                    group_data = plot_data[plot_data[color] == group_name]
-                    if orientation == 'v':
-                        fig.add_trace(go.Bar(
-                            x=group_data[x],
-                            y=group_data[y],
-                            name=str(group_name)
-                        ))
-                    else:
-                        fig.add_trace(go.Bar(
-                            y=group_data[x],
-                            x=group_data[y],
-                            name=str(group_name),
-                            orientation='h'
-                        ))
+                traces.append({'type': 'bar', 'x': labels, 'y': counts})
             else:
+                traces.append({'type': 'bar', 'y': labels, 'x': counts,
+                               'orientation': 'h'})
+        elif color and color in cols:
+            # Grouped by color
+            needed = list(dict.fromkeys((x, y, color)))
+            projected = _with_categorical_grouper(plot_data[needed], color)
+            for group_name, group_data in projected.groupby(color, sort=False, observed=True):
+                trace = {'type': 'bar', 'name': str(group_name)}
+                cats, vals = _as_np(group_data[x]), _as_np(group_data[y])
                 if orientation == 'v':
-                    fig.add_trace(go.Bar(x=plot_data[x], y=plot_data[y]))
+                    trace.update(x=cats, y=vals)
                 else:
-                    fig.add_trace(go.Bar(y=plot_data[x], x=plot_data[y], orientation='h'))
+                    trace.update(x=vals, y=cats, orientation='h')
+                traces.append(trace)
+        else:
+            cats, vals = _as_np(plot_data[x]), _as_np(plot_data[y])
+            if orientation == 'v':
+                traces.append({'type': 'bar', 'x': cats, 'y': vals})
+            else:
+                traces.append({'type': 'bar', 'x': vals, 'y': cats,
+                               'orientation': 'h'})
 
-        fig.update_layout(
-            title=title or f"Bar Chart",
+        return _figure(traces, _layout(
+            title or f"Bar Chart",
             xaxis_title=x_label or (x if orientation == 'v' else (y if y else "Count")),
             yaxis_title=y_label or ((y if y else "Count") if orientation == 'v' else x),
-            template='plotly_white',
             barmode=bar_mode
-        )
-
-        return fig.to_dict()
+        ))
 
     @staticmethod
     def create_scatter_chart(data: pd.DataFrame, x: str, y: str,
@@ -171,97 +578,143 @@ class ChartGenerator:
                            color_numeric: Optional[str] = None,
                            **options) -> dict:
         """Create a scatter plot with optional trendline and numeric color"""
-        fig = go.Figure()
-
-        hover_template = f"<b>{x}</b>: %{{x}}<br><b>{y}</b>: %{{y}}"
-        if color:
-            hover_template += f"<br><b>{color}</b>: %{{text}}"
-        if size:
-            hover_template += f"<br><b>{size}</b>: %{{marker.size}}"
+        cols = frozenset(data.columns)
+        traces = []
+
+        # Uniform sampling beyond the marker cap; the continuous-color
+        # branch is left at full resolution since its color mapping is
+        # the point of the chart
+        sampled_from = 0
+
+        # Only references fields the traces will carry, so no trace pays
+        # for placeholders that never resolve; memoized across calls
+        hover_template = _scatter_hover_template(
+            x, y,
+            color if (color and color in cols) else None,
+            size if (size and size in cols) else None
+        )
 
-        if color_numeric and color_numeric in data.columns:
+        if color_numeric and color_numeric in cols:
             # Continuous numeric color mapping
-            marker_size = data[size] if (size and size in data.columns) else 8
-            fig.add_trace(go.Scatter(
-                x=data[x],
-                y=data[y],
-                mode='markers',
-                marker=dict(
-                    size=marker_size,
-                    color=data[color_numeric],
-                    colorscale='Viridis',
-                    showscale=True,
-                    colorbar=dict(title=color_numeric)
-                ),
-                hovertemplate=f"<b>{x}</b>: %{{x}}<br><b>{y}</b>: %{{y}}<br><b>{color_numeric}</b>: %{{marker.color}}<extra></extra>"
-            ))
-        elif color and color in data.columns:
-            for group_name in data[color].unique():
-                group_data = data[data[color] == group_name]
-                marker_size = group_data[size] if (size and size in data.columns) else 8
-
-                fig.add_trace(go.Scatter(
-                    x=group_data[x],
-                    y=group_data[y],
-                    mode='markers',
-                    name=str(group_name),
-                    marker=dict(size=marker_size),
-                    text=str(group_name),
-                    hovertemplate=hover_template
-                ))
+            marker_size = _as_np(data[size]) if (size and size in cols) else 8
+            traces.append({
+                'type': 'scatter',
+                'x': _as_np(data[x]),
+                'y': _as_np(data[y]),
+                'mode': 'markers',
+                'marker': {
+                    'size': marker_size,
+                    'color': _as_np(data[color_numeric]),
+                    'colorscale': 'Viridis',
+                    'showscale': True,
+                    'colorbar': {'title': {'text': color_numeric}}
+                },
+                'hovertemplate': f"<b>{x}</b>: %{{x}}<br><b>{y}</b>: %{{y}}<br><b>{color_numeric}</b>: %{{marker.color}}<extra></extra>"
+            })
+        elif color and color in cols:
+            x_arr, y_arr = _as_np(data[x]), _as_np(data[y])
+            size_arr = _as_np(data[size]) if (size and size in cols) else None
+            # Stratified cap: each group keeps its proportional share
+            n = len(x_arr)
+            scale = _SCATTER_MAX_POINTS / n if n > _SCATTER_MAX_POINTS else None
+            if scale is not None:
+                sampled_from = n
+                rng = np.random.default_rng(42)
+            for group_name, idx in _group_positions(data[color]):
+                if scale is not None and len(idx) > 1:
+                    sub = rng.choice(len(idx), size=max(1, int(len(idx) * scale)),
+                                     replace=False)
+                    sub.sort()
+                    idx = idx[sub]
+                label = str(group_name)
+
+                traces.append({
+                    'type': 'scatter',
+                    'x': x_arr[idx],
+                    'y': y_arr[idx],
+                    'mode': 'markers',
+                    'name': label,
+                    'marker': {'size': size_arr[idx] if size_arr is not None else 8},
+                    'text': label,
+                    'hovertemplate': hover_template
+                })
         else:
-            marker_size = data[size] if (size and size in data.columns) else 8
-            fig.add_trace(go.Scatter(
-                x=data[x],
-                y=data[y],
-                mode='markers',
-                marker=dict(size=marker_size),
-                hovertemplate=hover_template
-            ))
+            x_arr, y_arr = _as_np(data[x]), _as_np(data[y])
+            size_arr = _as_np(data[size]) if (size and size in cols) else None
+            sel = _sample_positions(len(x_arr), _SCATTER_MAX_POINTS)
+            if sel is not None:
+                sampled_from = len(x_arr)
+                x_arr, y_arr = x_arr[sel], y_arr[sel]
+                if size_arr is not None:
+                    size_arr = size_arr[sel]
+            traces.append({
+                'type': 'scatter',
+                'x': x_arr,
+                'y': y_arr,
+                'mode': 'markers',
+                'marker': {'size': size_arr if size_arr is not None else 8},
+                'hovertemplate': hover_template
+            })
 
         # Trendline
         if show_trendline:
-            clean = data[[x, y]].dropna()
-            x_vals = pd.to_numeric(clean[x], errors='coerce')
-            y_vals = pd.to_numeric(clean[y], errors='coerce')
-            mask = x_vals.notna() & y_vals.notna()
-            x_vals = x_vals[mask].values
-            y_vals = y_vals[mask].values
+            # Already-numeric columns skip pd.to_numeric's per-element
+            # coercion; only object/mixed columns take the slow path
+            xs_raw = data[x].to_numpy()
+            ys_raw = data[y].to_numpy()
+            if not np.issubdtype(xs_raw.dtype, np.number):
+                xs_raw = pd.to_numeric(data[x], errors='coerce').to_numpy()
+            if not np.issubdtype(ys_raw.dtype, np.number):
+                ys_raw = pd.to_numeric(data[y], errors='coerce').to_numpy()
+            xs_raw = xs_raw.astype(np.float64, copy=False)
+            ys_raw = ys_raw.astype(np.float64, copy=False)
+            mask = ~(np.isnan(xs_raw) | np.isnan(ys_raw))
+            x_vals = xs_raw[mask]
+            y_vals = ys_raw[mask]
 
             if len(x_vals) > 1:
                 degree = max(1, min(trendline_degree, 5))
-                coeffs = np.polyfit(x_vals, y_vals, degree)
-                x_sorted = np.sort(x_vals)
-                y_fit = np.polyval(coeffs, x_sorted)
+                n = x_vals.size
+                if degree == 1:
+                    # Closed-form least squares: three dot products
+                    # instead of polyfit's Vandermonde matrix + lstsq
+                    sx = x_vals.sum()
+                    sy = y_vals.sum()
+                    sxx = x_vals @ x_vals
+                    sxy = x_vals @ y_vals
+                    denom = n * sxx - sx * sx
+                    slope = (n * sxy - sx * sy) / denom if denom != 0 else 0.0
+                    intercept = (sy - slope * sx) / n
+                    coeffs = np.array([slope, intercept])
+                else:
+                    coeffs = np.polyfit(x_vals, y_vals, degree)
 
-                # Calculate R-squared
-                y_pred = np.polyval(coeffs, x_vals)
-                ss_res = np.sum((y_vals - y_pred) ** 2)
-                ss_tot = np.sum((y_vals - np.mean(y_vals)) ** 2)
+                # R-squared from the fused Horner + sum-of-squares pass;
+                # the full-length prediction array never materializes,
+                # only the sorted line actually drawn
+                ss_res, ss_tot = _trend_fused(x_vals, y_vals, coeffs)
                 r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
 
+                x_sorted = np.sort(x_vals, kind='stable')
+                y_fit = np.polyval(coeffs, x_sorted)
+
                 # Build equation string
                 if degree == 1:
                     eq_str = f"y = {coeffs[0]:.2f}x + {coeffs[1]:.2f}"
                 else:
-                    terms = []
-                    for i, c in enumerate(coeffs):
-                        power = degree - i
-                        if power == 0:
-                            terms.append(f"{c:.2f}")
-                        elif power == 1:
-                            terms.append(f"{c:.2f}x")
-                        else:
-                            terms.append(f"{c:.2f}x^{power}")
-                    eq_str = " + ".join(terms)
-
-                fig.add_trace(go.Scatter(
-                    x=x_sorted,
-                    y=y_fit,
-                    mode='lines',
-                    name=f'Trendline (R²={r_squared:.4f})',
-                    line=dict(color='red', width=2, dash='dash')
-                ))
+                    eq_str = " + ".join(
+                        _TERM_FMT[p].format(c) if p < 2 else f"{c:.2f}x^{p}"
+                        for c, p in zip(coeffs, range(degree, -1, -1))
+                    )
+
+                traces.append({
+                    'type': 'scatter',
+                    'x': x_sorted,
+                    'y': y_fit,
+                    'mode': 'lines',
+                    'name': f'Trendline (R²={r_squared:.4f})',
+                    'line': {'color': 'red', 'width': 2, 'dash': 'dash'}
+                })
 
                 # Add equation annotation below the plot area
                 # fig.add_annotation(
@@ -278,23 +731,24 @@ class ChartGenerator:
                 #     align="center"
                 # )
 
-        fig.update_layout(
-            title=title or f"{y} vs {x}",
+        layout = _layout(
+            title or f"{y} vs {x}",
             xaxis_title=x_label or x,
             yaxis_title=y_label or y,
             hovermode='closest',
-            template='plotly_white',
-            margin=dict(b=80) if show_trendline else None,
-            legend=dict(
-                orientation='h',
-                yanchor='bottom',
-                y=1.02,
-                xanchor='center',
-                x=0.5
-            ) if (color or color_numeric) else None
+            margin={'b': 80} if show_trendline else None,
+            legend={
+                'orientation': 'h',
+                'yanchor': 'bottom',
+                'y': 1.02,
+                'xanchor': 'center',
+                'x': 0.5
+            } if (color or color_numeric) else None
         )
+        if sampled_from:
+            layout['meta'] = {'downsampled_from': sampled_from}
 
-        return fig.to_dict()
+        return _figure(traces, layout)
 
     @staticmethod
     def create_histogram(data: pd.DataFrame, column: str,
@@ -306,61 +760,87 @@ class ChartGenerator:
                         show_statistics: bool = False,
                         **options) -> dict:
         """Create a histogram with optional distribution fit and statistics"""
-        fig = go.Figure()
-
+        cols = frozenset(data.columns)
         col_data = data[column].dropna()
-
-        if color and color in data.columns:
-            for group_name in data[color].unique():
-                group_data = data[data[color] == group_name]
-                fig.add_trace(go.Histogram(
-                    x=group_data[column],
-                    name=str(group_name),
-                    nbinsx=bins,
-                    opacity=0.7
-                ))
-            fig.update_layout(barmode='overlay')
+        numeric = pd.api.types.is_numeric_dtype(col_data)
+        # One materialization, many readers: binning, fitting and the
+        # statistics below all work off the same ndarray
+        arr = _as_np(col_data) if numeric else None
+        traces = []
+        overlay = False
+
+        if color and color in cols:
+            overlay = True
+            full = _as_np(data[column])
+            if numeric:
+                # Shared edges so the per-group overlays line up; with
+                # explicit edges np.histogram simply ignores NaNs, so the
+                # groups need no per-group dropna
+                edges = np.histogram_bin_edges(arr, bins=bins)
+                for group_name, idx in _group_positions(data[color]):
+                    centers, counts, widths = _prebinned_hist(full[idx], edges)
+                    traces.append({
+                        'type': 'bar',
+                        'x': centers,
+                        'y': counts,
+                        'width': widths,
+                        'name': str(group_name),
+                        'opacity': 0.7
+                    })
+            else:
+                # Non-numeric columns keep client-side binning
+                for group_name, idx in _group_positions(data[color]):
+                    traces.append({
+                        'type': 'histogram',
+                        'x': full[idx],
+                        'name': str(group_name),
+                        'nbinsx': bins,
+                        'opacity': 0.7
+                    })
+        elif numeric:
+            centers, counts, widths = _prebinned_hist(
+                arr, bins, density=show_distribution_fit
+            )
+            traces.append({
+                'type': 'bar',
+                'x': centers,
+                'y': counts,
+                'width': widths,
+                'name': column
+            })
         else:
-            fig.add_trace(go.Histogram(
-                x=col_data,
-                nbinsx=bins,
-                name=column,
-                histnorm='probability density' if show_distribution_fit else None
-            ))
+            trace = {
+                'type': 'histogram',
+                'x': _as_np(col_data),
+                'nbinsx': bins,
+                'name': column
+            }
+            if show_distribution_fit:
+                trace['histnorm'] = 'probability density'
+            traces.append(trace)
 
         # Distribution fit overlay
-        if show_distribution_fit and len(col_data) > 1:
-            from scipy import stats as scipy_stats
+        if show_distribution_fit and numeric and len(arr) > 1:
+            scipy_stats = _scipy_stats()
 
-            mu, sigma = scipy_stats.norm.fit(col_data)
-            x_range = np.linspace(float(col_data.min()), float(col_data.max()), 200)
+            mu, sigma = scipy_stats.norm.fit(arr)
+            x_range = np.linspace(float(arr.min()), float(arr.max()), 200)
             pdf_values = scipy_stats.norm.pdf(x_range, mu, sigma)
 
-            fig.add_trace(go.Scatter(
-                x=x_range,
-                y=pdf_values,
-                mode='lines',
-                name=f'Normal Fit (\u03bc={mu:.2f}, \u03c3={sigma:.2f})',
-                line=dict(color='red', width=2.5)
-            ))
+            traces.append({
+                'type': 'scatter',
+                'x': x_range,
+                'y': pdf_values,
+                'mode': 'lines',
+                'name': f'Normal Fit (\u03bc={mu:.2f}, \u03c3={sigma:.2f})',
+                'line': {'color': 'red', 'width': 2.5}
+            })
 
         # Statistics annotation
-        if show_statistics and len(col_data) > 0:
-            from scipy import stats as scipy_stats
-
-            n = len(col_data)
-            mean_val = float(col_data.mean())
-            std_val = float(col_data.std())
-            median_val = float(col_data.median())
-            skewness = float(col_data.skew())
-            kurtosis = float(col_data.kurtosis())
-
-            # Shapiro-Wilk test (limit sample size for performance)
-            sample = col_data if n <= 5000 else col_data.sample(5000, random_state=42)
-            try:
-                _, shapiro_p = scipy_stats.shapiro(sample)
-            except Exception:
-                shapiro_p = None
+        annotations = None
+        if show_statistics and numeric and len(arr) > 0:
+            (n, mean_val, std_val, median_val,
+             skewness, kurtosis, shapiro_p) = _hist_stats(arr)
 
             stats_lines = [
                 f"<b>Statistics</b>",
@@ -374,28 +854,31 @@ class ChartGenerator:
             if shapiro_p is not None:
                 stats_lines.append(f"Shapiro-Wilk p = {shapiro_p:.4e}")
 
-            fig.add_annotation(
-                text="<br>".join(stats_lines),
-                xref="paper", yref="paper",
-                x=0.98, y=0.98,
-                xanchor="right", yanchor="top",
-                showarrow=False,
-                bordercolor="black",
-                borderwidth=1,
-                borderpad=6,
-                bgcolor="rgba(255, 255, 255, 0.85)",
-                font=dict(family="monospace", size=11),
-                align="left"
-            )
-
-        fig.update_layout(
-            title=title or f"Distribution of {column}",
+            annotations = [{
+                'text': "<br>".join(stats_lines),
+                'xref': "paper", 'yref': "paper",
+                'x': 0.98, 'y': 0.98,
+                'xanchor': "right", 'yanchor': "top",
+                'showarrow': False,
+                'bordercolor': "black",
+                'borderwidth': 1,
+                'borderpad': 6,
+                'bgcolor': "rgba(255, 255, 255, 0.85)",
+                'font': {'family': "monospace", 'size': 11},
+                'align': "left"
+            }]
+
+        layout = _layout(
+            title or f"Distribution of {column}",
             xaxis_title=x_label or column,
-            yaxis_title="Probability Density" if show_distribution_fit else "Frequency",
-            template='plotly_white'
+            yaxis_title="Probability Density" if show_distribution_fit else "Frequency"
         )
+        if overlay:
+            layout['barmode'] = 'overlay'
+        if annotations:
+            layout['annotations'] = annotations
 
-        return fig.to_dict()
+        return _figure(traces, layout)
 
     @staticmethod
     def create_box_plot(data: pd.DataFrame, x: Optional[str] = None,
@@ -406,63 +889,44 @@ class ChartGenerator:
                        horizontal: bool = False,
                        **options) -> dict:
         """Create a box plot with optional data points and horizontal orientation"""
-        fig = go.Figure()
+        cols = frozenset(data.columns)
+        axis = 'x' if horizontal else 'y'
 
-        box_kwargs = {}
+        box_kwargs = {'type': 'box', 'boxmean': 'sd'}
         if show_points:
             box_kwargs['boxpoints'] = 'all'
             box_kwargs['jitter'] = 0.3
             box_kwargs['pointpos'] = -1.5
 
-        if x and x in data.columns:
-            for group_name in sorted(data[x].unique()):
-                group_data = data[data[x] == group_name]
-                if horizontal:
-                    fig.add_trace(go.Box(
-                        x=group_data[y],
-                        name=str(group_name),
-                        boxmean='sd',
-                        **box_kwargs
-                    ))
-                else:
-                    fig.add_trace(go.Box(
-                        y=group_data[y],
-                        name=str(group_name),
-                        boxmean='sd',
-                        **box_kwargs
-                    ))
-        else:
-            if horizontal:
-                fig.add_trace(go.Box(
-                    x=data[y],
-                    name=y,
-                    boxmean='sd',
-                    **box_kwargs
-                ))
-            else:
-                fig.add_trace(go.Box(
-                    y=data[y],
-                    name=y,
-                    boxmean='sd',
+        traces = []
+        if x and x in cols:
+            # groupby sorts the keys once and partitions in a single pass,
+            # replacing the per-group boolean mask re-scan
+            needed = list(dict.fromkeys((x, y)))
+            projected = _with_categorical_grouper(data[needed], x)
+            for group_name, group_data in projected.groupby(x, sort=True, observed=True):
+                traces.append({
+                    axis: _as_np(group_data[y]),
+                    'name': str(group_name),
                     **box_kwargs
-                ))
+                })
+        else:
+            traces.append({axis: _as_np(data[y]), 'name': y, **box_kwargs})
 
         if horizontal:
-            fig.update_layout(
-                title=title or f"Box Plot of {y}",
+            layout = _layout(
+                title or f"Box Plot of {y}",
                 xaxis_title=y,
-                yaxis_title=x if x else "",
-                template='plotly_white'
+                yaxis_title=x if x else ""
             )
         else:
-            fig.update_layout(
-                title=title or f"Box Plot of {y}",
-                yaxis_title=y,
+            layout = _layout(
+                title or f"Box Plot of {y}",
                 xaxis_title=x if x else "",
-                template='plotly_white'
+                yaxis_title=y
             )
 
-        return fig.to_dict()
+        return _figure(traces, layout)
 
     @staticmethod
     def create_violin_plot(data: pd.DataFrame, x: Optional[str] = None,
@@ -473,69 +937,49 @@ class ChartGenerator:
                           horizontal: bool = False,
                           **options) -> dict:
         """Create a violin plot with optional data points and horizontal orientation"""
-        fig = go.Figure()
-
-        violin_kwargs = {}
+        cols = frozenset(data.columns)
+        axis = 'x' if horizontal else 'y'
+
+        violin_kwargs = {
+            'type': 'violin',
+            'box': {'visible': True},
+            'meanline': {'visible': True}
+        }
+        if horizontal:
+            violin_kwargs['orientation'] = 'h'
         if show_points:
             violin_kwargs['points'] = 'all'
             violin_kwargs['jitter'] = 0.3
             violin_kwargs['pointpos'] = -1.5
 
-        if x and x in data.columns:
-            for group_name in sorted(data[x].unique()):
-                group_data = data[data[x] == group_name]
-                if horizontal:
-                    fig.add_trace(go.Violin(
-                        x=group_data[y],
-                        name=str(group_name),
-                        box_visible=True,
-                        meanline_visible=True,
-                        orientation='h',
-                        **violin_kwargs
-                    ))
-                else:
-                    fig.add_trace(go.Violin(
-                        y=group_data[y],
-                        name=str(group_name),
-                        box_visible=True,
-                        meanline_visible=True,
-                        **violin_kwargs
-                    ))
-        else:
-            if horizontal:
-                fig.add_trace(go.Violin(
-                    x=data[y],
-                    name=y,
-                    box_visible=True,
-                    meanline_visible=True,
-                    orientation='h',
+        traces = []
+        if x and x in cols:
+            # Same sort-once groupby as the box plot
+            needed = list(dict.fromkeys((x, y)))
+            projected = _with_categorical_grouper(data[needed], x)
+            for group_name, group_data in projected.groupby(x, sort=True, observed=True):
+                traces.append({
+                    axis: _as_np(group_data[y]),
+                    'name': str(group_name),
                     **violin_kwargs
-                ))
-            else:
-                fig.add_trace(go.Violin(
-                    y=data[y],
-                    name=y,
-                    box_visible=True,
-                    meanline_visible=True,
-                    **violin_kwargs
-                ))
+                })
+        else:
+            traces.append({axis: _as_np(data[y]), 'name': y, **violin_kwargs})
 
         if horizontal:
-            fig.update_layout(
-                title=title or f"Violin Plot of {y}",
+            layout = _layout(
+                title or f"Violin Plot of {y}",
                 xaxis_title=y,
-                yaxis_title=x if x else "",
-                template='plotly_white'
+                yaxis_title=x if x else ""
             )
         else:
-            fig.update_layout(
-                title=title or f"Violin Plot of {y}",
-                yaxis_title=y,
+            layout = _layout(
+                title or f"Violin Plot of {y}",
                 xaxis_title=x if x else "",
-                template='plotly_white'
+                yaxis_title=y
             )
 
-        return fig.to_dict()
+        return _figure(traces, layout)
 
     @staticmethod
     def create_heatmap(data: pd.DataFrame,
@@ -544,63 +988,77 @@ class ChartGenerator:
                       show_annotations: bool = True,
                       **options) -> dict:
         """Create a correlation heatmap with configurable colorscale and annotations"""
-        # Assume data is a correlation matrix or compute it
+        # Assume data is a correlation matrix or compute it. The matrix
+        # comes from DataAnalyzer so the heatmap and the correlation
+        # endpoint share one NaN policy (per-column mean imputation) and
+        # one fingerprint-keyed cache.
         if data.shape[0] != data.shape[1]:
-            # Not a correlation matrix, compute it
-            numeric_data = data.select_dtypes(include=[np.number])
-            corr_matrix = numeric_data.corr()
+            corr_matrix = DataAnalyzer.get_correlation_matrix(data)
         else:
             corr_matrix = data
 
-        heatmap_kwargs = dict(
-            z=corr_matrix.values,
-            x=corr_matrix.columns,
-            y=corr_matrix.columns,
-            colorscale=colorscale,
-            zmid=0,
-            colorbar=dict(title="Correlation")
-        )
+        # float32 halves the typed-array payload; correlations have no
+        # visible precision to lose at two displayed decimals
+        z32 = corr_matrix.to_numpy(dtype=np.float32)
+        heatmap_kwargs = {
+            'z': z32,
+            'x': _as_np(corr_matrix.columns),
+            'y': _as_np(corr_matrix.columns),
+            'colorscale': colorscale,
+            'zmid': 0,
+            'colorbar': {'title': {'text': "Correlation"}}
+        }
 
         if show_annotations:
-            heatmap_kwargs['text'] = corr_matrix.values
-            heatmap_kwargs['texttemplate'] = '%{text:.2f}'
+            # Preformat in one C-level pass; shipping the float matrix
+            # plus a '%{text:.2f}' template makes plotly.js run a d3
+            # format call per cell client-side, and the fixed-width
+            # strings are smaller on the wire than float64 text values
+            heatmap_kwargs['text'] = np.char.mod('%.2f', z32.astype(np.float64))
+            heatmap_kwargs['texttemplate'] = '%{text}'
             heatmap_kwargs['textfont'] = {"size": 10}
 
-        fig = go.Figure(data=go.Heatmap(**heatmap_kwargs))
-
-        fig.update_layout(
-            title=title or "Correlation Heatmap",
-            xaxis=dict(side='bottom'),
-            template='plotly_white'
-        )
-
-        return fig.to_dict()
+        return _figure([{'type': 'heatmap', **heatmap_kwargs}], _layout(
+            title or "Correlation Heatmap",
+            xaxis={'side': 'bottom'}
+        ))
 
     @staticmethod
     def create_distribution_plot(data: pd.DataFrame, columns: list[str],
                                 title: Optional[str] = None,
                                 **options) -> dict:
         """Create overlaid distribution plots"""
-        fig = go.Figure()
-
+        cols = frozenset(data.columns)
+        traces = []
         for col in columns:
-            if col in data.columns:
-                fig.add_trace(go.Histogram(
-                    x=data[col],
-                    name=col,
-                    opacity=0.6,
-                    nbinsx=30
-                ))
-
-        fig.update_layout(
-            title=title or "Distribution Comparison",
+            if col not in cols:
+                continue
+            col_data = data[col].dropna()
+            if pd.api.types.is_numeric_dtype(col_data):
+                centers, counts, widths = _prebinned_hist(_as_np(col_data), 30)
+                traces.append({
+                    'type': 'bar',
+                    'x': centers,
+                    'y': counts,
+                    'width': widths,
+                    'name': col,
+                    'opacity': 0.6
+                })
+            else:
+                traces.append({
+                    'type': 'histogram',
+                    'x': _as_np(col_data),
+                    'name': col,
+                    'opacity': 0.6,
+                    'nbinsx': 30
+                })
+
+        return _figure(traces, _layout(
+            title or "Distribution Comparison",
             xaxis_title="Value",
             yaxis_title="Frequency",
-            barmode='overlay',
-            template='plotly_white'
-        )
-
-        return fig.to_dict()
+            barmode='overlay'
+        ))
 
     @staticmethod
     def create_time_series(data: pd.DataFrame, date_column: str,
@@ -608,41 +1066,52 @@ class ChartGenerator:
                           title: Optional[str] = None,
                           **options) -> dict:
         """Create a time series chart"""
-        fig = go.Figure()
+        # Convert the date axis once, not per value column
+        dates = _dates(data, date_column)
 
+        cols = frozenset(data.columns)
+        traces = []
+        downsampled_from = 0
         for col in value_columns:
-            if col in data.columns:
-                fig.add_trace(go.Scatter(
-                    x=data[date_column],
-                    y=data[col],
-                    mode='lines+markers',
-                    name=col,
-                    line=dict(width=2),
-                    marker=dict(size=4)
-                ))
-
-        fig.update_layout(
-            title=title or "Time Series",
+            if col in cols:
+                xs, ys, source_points = _maybe_downsample(
+                    dates, _as_np(data[col])
+                )
+                if len(ys) < source_points:
+                    downsampled_from = max(downsampled_from, source_points)
+                traces.append({
+                    'type': 'scatter',
+                    'x': xs,
+                    'y': ys,
+                    'mode': 'lines+markers',
+                    'name': col,
+                    'line': {'width': 2},
+                    'marker': {'size': 4}
+                })
+
+        layout = _layout(
+            title or "Time Series",
             xaxis_title=date_column,
             yaxis_title="Value",
             hovermode='x unified',
-            template='plotly_white',
-            xaxis=dict(
-                rangeselector=dict(
-                    buttons=list([
-                        dict(count=1, label="1d", step="day", stepmode="backward"),
-                        dict(count=7, label="1w", step="day", stepmode="backward"),
-                        dict(count=1, label="1m", step="month", stepmode="backward"),
-                        dict(count=3, label="3m", step="month", stepmode="backward"),
-                        dict(step="all", label="All")
-                    ])
-                ),
-                rangeslider=dict(visible=True),
-                type='date'
-            )
+            xaxis={
+                'rangeselector': {
+                    'buttons': [
+                        {'count': 1, 'label': "1d", 'step': "day", 'stepmode': "backward"},
+                        {'count': 7, 'label': "1w", 'step': "day", 'stepmode': "backward"},
+                        {'count': 1, 'label': "1m", 'step': "month", 'stepmode': "backward"},
+                        {'count': 3, 'label': "3m", 'step': "month", 'stepmode': "backward"},
+                        {'step': "all", 'label': "All"}
+                    ]
+                },
+                'rangeslider': {'visible': True},
+                'type': 'date'
+            }
         )
+        if downsampled_from:
+            layout['meta'] = {'downsampled_from': downsampled_from}
 
-        return fig.to_dict()
+        return _figure(traces, layout)
 
     @staticmethod
     def create_candlestick(data: pd.DataFrame, date_column: str,
@@ -651,23 +1120,20 @@ class ChartGenerator:
                           title: Optional[str] = None,
                           **options) -> dict:
         """Create a candlestick chart (useful for process min/max/avg data)"""
-        fig = go.Figure(data=[go.Candlestick(
-            x=data[date_column],
-            open=data[open_col],
-            high=data[high_col],
-            low=data[low_col],
-            close=data[close_col]
-        )])
-
-        fig.update_layout(
-            title=title or "Process Data (OHLC)",
+        trace = {
+            'x': _dates(data, date_column),
+            'open': _as_np(data[open_col]),
+            'high': _as_np(data[high_col]),
+            'low': _as_np(data[low_col]),
+            'close': _as_np(data[close_col])
+        }
+
+        return _figure([{'type': 'candlestick', **trace}], _layout(
+            title or "Process Data (OHLC)",
             xaxis_title=date_column,
             yaxis_title="Value",
-            xaxis_rangeslider_visible=False,
-            template='plotly_white'
-        )
-
-        return fig.to_dict()
+            xaxis={'rangeslider': {'visible': False}}
+        ))
 
     @staticmethod
     def create_range_plot(data: pd.DataFrame, date_column: str,
@@ -676,49 +1142,78 @@ class ChartGenerator:
                          title: Optional[str] = None,
                          **options) -> dict:
         """Create a range plot with confidence intervals"""
-        fig = go.Figure()
-
-        # Add range as filled area
-        fig.add_trace(go.Scatter(
-            x=data[date_column],
-            y=data[upper_col],
-            mode='lines',
-            line=dict(width=0),
-            showlegend=False,
-            name='Upper'
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=data[date_column],
-            y=data[lower_col],
-            mode='lines',
-            line=dict(width=0),
-            fillcolor='rgba(68, 68, 68, 0.3)',
-            fill='tonexty',
-            showlegend=False,
-            name='Lower'
-        ))
+        dates = _dates(data, date_column)
+
+        # Range as filled area: upper bound first, lower fills to it
+        traces = [
+            {
+                'type': 'scatter',
+                'x': dates,
+                'y': _as_np(data[upper_col]),
+                'mode': 'lines',
+                'line': {'width': 0},
+                'showlegend': False,
+                'name': 'Upper'
+            },
+            {
+                'type': 'scatter',
+                'x': dates,
+                'y': _as_np(data[lower_col]),
+                'mode': 'lines',
+                'line': {'width': 0},
+                'fillcolor': 'rgba(68, 68, 68, 0.3)',
+                'fill': 'tonexty',
+                'showlegend': False,
+                'name': 'Lower'
+            }
+        ]
 
         # Add center line if provided
         if center_col and center_col in data.columns:
-            fig.add_trace(go.Scatter(
-                x=data[date_column],
-                y=data[center_col],
-                mode='lines+markers',
-                name='Center',
-                line=dict(color='blue', width=2),
-                marker=dict(size=4)
-            ))
-
-        fig.update_layout(
-            title=title or "Range Plot",
+            traces.append({
+                'type': 'scatter',
+                'x': dates,
+                'y': _as_np(data[center_col]),
+                'mode': 'lines+markers',
+                'name': 'Center',
+                'line': {'color': 'blue', 'width': 2},
+                'marker': {'size': 4}
+            })
+
+        return _figure(traces, _layout(
+            title or "Range Plot",
             xaxis_title=date_column,
             yaxis_title="Value",
-            hovermode='x unified',
-            template='plotly_white'
-        )
+            hovermode='x unified'
+        ))
 
-        return fig.to_dict()
+    # Figure cache: dashboard redraws repeat the exact same chart request
+    # over unchanged data, and rebuilding the figure is the expensive part.
+    # The JSON cache sits alongside it so repeat requests skip
+    # serialization too, not just figure construction.
+    _FIGURE_CACHE: dict[tuple, dict] = {}
+    _FIGURE_JSON_CACHE: dict[tuple, bytes] = {}
+    _FIGURE_CACHE_MAX = 256
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached figures and derived analytics"""
+        cls._FIGURE_CACHE.clear()
+        cls._FIGURE_JSON_CACHE.clear()
+        DataAnalyzer._CORR_CACHE.clear()
+        _HIST_STATS_CACHE.clear()
+
+    @classmethod
+    def _figure_key(cls, chart_type: ChartType, data: pd.DataFrame,
+                    x, y, color, size, title, x_label, y_label,
+                    options: dict) -> tuple:
+        """Cache key covering everything a chart request depends on"""
+        return (
+            chart_type,
+            DataAnalyzer._data_fingerprint(data),
+            x, y, color, size, title, x_label, y_label,
+            tuple(sorted((k, repr(v)) for k, v in options.items()))
+        )
 
     @classmethod
     def generate_chart(cls, chart_type: ChartType, data: pd.DataFrame,
@@ -733,6 +1228,10 @@ class ChartGenerator:
         """
         Main entry point for chart generation.
 
+        Repeat calls with the same arguments over the same DataFrame are
+        served from a bounded cache; callers must not mutate the returned
+        dictionary.
+
         Args:
             chart_type: Type of chart to generate
             data: DataFrame with the data
@@ -748,29 +1247,121 @@ class ChartGenerator:
         Returns:
             Plotly figure dictionary
         """
-        if chart_type == ChartType.LINE:
-            return cls.create_line_chart(data, x, y, color, title, x_label, y_label, **options)
-        elif chart_type == ChartType.BAR:
-            return cls.create_bar_chart(data, x, y, color=color, title=title, x_label=x_label, y_label=y_label, **options)
-        elif chart_type == ChartType.SCATTER:
-            return cls.create_scatter_chart(data, x, y, color, size, title, x_label, y_label, **options)
-        elif chart_type == ChartType.HISTOGRAM:
-            return cls.create_histogram(data, x or y, color=color, title=title, x_label=x_label, **options)
-        elif chart_type == ChartType.BOX:
-            return cls.create_box_plot(data, x, y, color, title, **options)
-        elif chart_type == ChartType.VIOLIN:
-            return cls.create_violin_plot(data, x, y, color, title, **options)
-        elif chart_type == ChartType.HEATMAP:
-            return cls.create_heatmap(data, title, **options)
-        elif chart_type == ChartType.DISTRIBUTION:
-            columns = options.get('columns', [x, y] if x and y else [])
-            return cls.create_distribution_plot(data, columns, title, **options)
-        elif chart_type == ChartType.TIME_SERIES:
-            value_cols = options.get('value_columns', [y] if y else [])
-            return cls.create_time_series(data, x, value_cols, title, **options)
-        elif chart_type == ChartType.CANDLESTICK:
-            return cls.create_candlestick(data, x, **options)
-        elif chart_type == ChartType.RANGE_PLOT:
-            return cls.create_range_plot(data, x, **options)
-        else:
+        key = cls._figure_key(chart_type, data, x, y, color, size,
+                              title, x_label, y_label, options)
+        cached = cls._FIGURE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        figure = cls._create_chart(chart_type, data, x, y, color, size,
+                                   title, x_label, y_label, **options)
+
+        if len(cls._FIGURE_CACHE) >= cls._FIGURE_CACHE_MAX:
+            # Drop the oldest entry (insertion order)
+            cls._FIGURE_CACHE.pop(next(iter(cls._FIGURE_CACHE)))
+        cls._FIGURE_CACHE[key] = figure
+
+        return figure
+
+    @classmethod
+    def generate_chart_json(cls, chart_type: ChartType, data: pd.DataFrame,
+                            x: Optional[str] = None,
+                            y: Optional[str] = None,
+                            color: Optional[str] = None,
+                            size: Optional[str] = None,
+                            title: Optional[str] = None,
+                            x_label: Optional[str] = None,
+                            y_label: Optional[str] = None,
+                            **options) -> bytes:
+        """
+        Generate a chart as serialized JSON bytes.
+
+        Callers that only ship the figure over the wire should use this
+        instead of generate_chart: the orjson encoding (numpy arrays
+        included) happens once per unique request and repeats are served
+        as ready-made bytes, skipping both figure construction and
+        serialization.
+        """
+        key = cls._figure_key(chart_type, data, x, y, color, size,
+                              title, x_label, y_label, options)
+        cached = cls._FIGURE_JSON_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        figure = cls.generate_chart(chart_type, data, x, y, color, size,
+                                    title, x_label, y_label, **options)
+        payload = orjson.dumps(
+            figure,
+            option=orjson.OPT_SERIALIZE_NUMPY,
+            default=_figure_json_default
+        )
+
+        if len(cls._FIGURE_JSON_CACHE) >= cls._FIGURE_CACHE_MAX:
+            cls._FIGURE_JSON_CACHE.pop(next(iter(cls._FIGURE_JSON_CACHE)))
+        cls._FIGURE_JSON_CACHE[key] = payload
+
+        return payload
+
+    @classmethod
+    def _create_chart(cls, chart_type: ChartType, data: pd.DataFrame,
+                      x: Optional[str] = None,
+                      y: Optional[str] = None,
+                      color: Optional[str] = None,
+                      size: Optional[str] = None,
+                      title: Optional[str] = None,
+                      x_label: Optional[str] = None,
+                      y_label: Optional[str] = None,
+                      **options) -> dict:
+        """Build a figure dictionary (uncached)"""
+        builder = cls._DISPATCH.get(chart_type)
+        if builder is None:
             raise ValueError(f"Unsupported chart type: {chart_type}")
+        figure = builder(cls, data, x, y, color, size, title, x_label, y_label, options)
+        if not RAW:
+            # Debug escape hatch: round-trip the raw dict through Plotly's
+            # validators to catch malformed figure structure
+            figure = _go().Figure(figure).to_dict()
+        return figure
+
+
+# O(1) dispatch table instead of an 11-branch if/elif chain; each entry
+# adapts the common generate_chart arguments to its create_* signature
+ChartGenerator._DISPATCH = {
+    ChartType.LINE:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_line_chart(d, x, y, color, title, xl, yl, **o),
+    ChartType.BAR:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_bar_chart(d, x, y, color=color, title=title,
+                                 x_label=xl, y_label=yl, **o),
+    ChartType.SCATTER:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_scatter_chart(d, x, y, color, size, title, xl, yl, **o),
+    ChartType.HISTOGRAM:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_histogram(d, x or y, color=color, title=title,
+                                 x_label=xl, **o),
+    ChartType.BOX:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_box_plot(d, x, y, color, title, **o),
+    ChartType.VIOLIN:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_violin_plot(d, x, y, color, title, **o),
+    ChartType.HEATMAP:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_heatmap(d, title, **o),
+    ChartType.DISTRIBUTION:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_distribution_plot(
+                d, o.pop('columns', [x, y] if x and y else []), title, **o),
+    ChartType.TIME_SERIES:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_time_series(
+                d, x, o.pop('value_columns', [y] if y else []), title, **o),
+    ChartType.CANDLESTICK:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_candlestick(d, x, **o),
+    ChartType.RANGE_PLOT:
+        lambda cls, d, x, y, color, size, title, xl, yl, o:
+            cls.create_range_plot(d, x, **o),
+}
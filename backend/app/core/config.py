@@ -20,19 +20,31 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024  # 100 MB
     UPLOAD_DIR: Path = Path("data")
     ALLOWED_EXTENSIONS: set[str] = {".csv"}
+    MAX_CONCURRENT_UPLOADS: int = 8
 
     # Database Settings
     SQL_SERVER_DRIVER: str = "ODBC Driver 17 for SQL Server"
     SQL_CONNECTION_TIMEOUT: int = 30
     SQL_QUERY_TIMEOUT: int = 300
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    # Matches pool_size + max_overflow so waiters queue here instead of
+    # piling up connection attempts on the server
+    SQL_MAX_CONCURRENT: int = 30
 
     # Data Processing Settings
     MAX_ROWS_PREVIEW: int = 1000
     DEFAULT_PAGE_SIZE: int = 100
     MAX_PAGE_SIZE: int = 10000
+    # Run memory-bound analytics (correlation) in float32; halves the
+    # bandwidth and dispatches the faster BLAS kernel. Set False to force
+    # full float64 precision.
+    ANALYTICS_FLOAT32: bool = True
 
     # Cache Settings
     CACHE_TTL: int = 3600  # 1 hour
+    METADATA_CACHE_TTL: int = 60  # seconds; schema metadata rarely changes
 
     class Config:
         case_sensitive = True
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from typing import Optional, Any
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
 from app.models.schemas import ColumnInfo, FilterCondition
 from app.core.config import settings
@@ -21,13 +23,70 @@ except ImportError:
     text = None
 
 
+def _filters_cache_key(filters: Optional[list[FilterCondition]]) -> tuple:
+    """Hashable key identifying a filter list"""
+    if not filters:
+        return ()
+    return tuple(
+        (f.column, f.operator, repr(f.value), repr(f.value2))
+        for f in filters
+    )
+
+
+def _contains_mask(col: pd.Series, value):
+    """Case-insensitive substring mask for the contains filter. String
+    columns go through Arrow's C++ substring matcher - no per-value
+    boxing, no regex engine; the astype(str) copy and the pandas str
+    accessor are only paid for non-string dtypes"""
+    if pd.api.types.is_string_dtype(col.dtype):
+        mask = pc.match_substring(pa.array(col), str(value), ignore_case=True)
+        return pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+    return col.astype(str).str.contains(str(value), case=False, na=False)
+
+
+def _ordering_values(col: pd.Series) -> pd.Series:
+    """Column values as used by ordering comparisons (gt/lt/gte/lte/
+    between). Unordered categoricals refuse anything but equality, so
+    dictionary-encoded columns are decoded back to their underlying
+    values first; the comparison then behaves exactly as it did on the
+    plain column the category encoding replaced"""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return col.astype(col.cat.categories.dtype)
+    return col
+
+
+def _between_mask(col: pd.Series, value, value2):
+    col = _ordering_values(col)
+    return (col >= value) & (col <= value2)
+
+
+# Filter operator -> mask builder. A specialized callable per operator,
+# resolved with one dict lookup, instead of walking an if/elif chain for
+# every filter on every query.
+_FILTER_OPS: dict[str, Any] = {
+    "eq": lambda col, value, value2: col == value,
+    "ne": lambda col, value, value2: col != value,
+    "gt": lambda col, value, value2: _ordering_values(col) > value,
+    "lt": lambda col, value, value2: _ordering_values(col) < value,
+    "gte": lambda col, value, value2: _ordering_values(col) >= value,
+    "lte": lambda col, value, value2: _ordering_values(col) <= value,
+    "contains": lambda col, value, value2: _contains_mask(col, value),
+    "in": lambda col, value, value2: col.isin(value if isinstance(value, list) else [value]),
+    "between": _between_mask,
+}
+
+
 class DataSource(ABC):
     """Abstract base class for data sources"""
 
+    # Bound on cached query results per source
+    _DATA_CACHE_MAX = 32
+
     def __init__(self, source_id: str, name: str):
         self.source_id = source_id
         self.name = name
         self._df: Optional[pd.DataFrame] = None
+        self._data_cache: dict[tuple, pd.DataFrame] = {}
 
     @abstractmethod
     def load_data(self) -> pd.DataFrame:
@@ -36,72 +95,109 @@ class DataSource(ABC):
 
     def get_data(self, filters: Optional[list[FilterCondition]] = None,
                  limit: Optional[int] = None, offset: int = 0,
-                 columns: Optional[list[str]] = None) -> pd.DataFrame:
+                 columns: Optional[list[str]] = None,
+                 with_total: bool = False):
         """
         Retrieve data with optional filtering and pagination.
 
+        Results are cached per (filters, limit, offset, columns) so the
+        endpoints that repeatedly ask for the same slice (summary,
+        correlation, suggestions, charts) share one DataFrame instead of
+        re-filtering or re-querying each time. Callers must not mutate
+        the returned frame.
+
         Args:
             filters: List of filter conditions
             limit: Maximum number of rows to return
             offset: Number of rows to skip
             columns: Specific columns to return
+            with_total: Also return the number of rows matching the
+                filters (before pagination)
 
         Returns:
-            Filtered DataFrame
+            Filtered DataFrame, or (DataFrame, total) if with_total
         """
+        key = (
+            _filters_cache_key(filters),
+            limit,
+            offset,
+            tuple(columns) if columns else None,
+            with_total
+        )
+        cached = self._data_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._fetch_data(filters, limit, offset, columns, with_total)
+
+        if len(self._data_cache) >= self._DATA_CACHE_MAX:
+            # Drop the oldest entry (insertion order)
+            self._data_cache.pop(next(iter(self._data_cache)))
+        self._data_cache[key] = result
+
+        return result
+
+    def _fetch_data(self, filters: Optional[list[FilterCondition]] = None,
+                    limit: Optional[int] = None, offset: int = 0,
+                    columns: Optional[list[str]] = None,
+                    with_total: bool = False):
+        """Produce the requested data slice (uncached)"""
         if self._df is None:
             self._df = self.load_data()
 
-        df = self._df.copy()
+        df = self._df
+        stop = offset + limit if limit is not None else None
 
-        # Apply filters
+        # Filter to row positions, then take exactly the requested page:
+        # the only allocation is sized to the output instead of copying
+        # the whole table up front
         if filters:
-            df = self._apply_filters(df, filters)
+            mask = self._filter_mask(df, filters)
+            idx = np.flatnonzero(mask)
+            total = idx.size
+            df = df.iloc[idx[offset:stop]]
+        else:
+            total = len(df)
+            df = df.iloc[offset:stop]
 
-        # Select specific columns
         if columns:
             df = df[columns]
 
-        # Apply pagination
-        if offset > 0:
-            df = df.iloc[offset:]
-        if limit is not None:
-            df = df.iloc[:limit]
-
+        if with_total:
+            return df, total
         return df
 
-    def _apply_filters(self, df: pd.DataFrame, filters: list[FilterCondition]) -> pd.DataFrame:
-        """Apply filter conditions to DataFrame"""
-        mask = pd.Series([True] * len(df), index=df.index)
+    def _filter_mask(self, df: pd.DataFrame, filters: list[FilterCondition]) -> np.ndarray:
+        """
+        Boolean row mask for the given filter conditions.
 
-        for filter_cond in filters:
-            column = filter_cond.column
-            operator = filter_cond.operator
-            value = filter_cond.value
+        Each operator resolves through _FILTER_OPS in one dict lookup
+        rather than an if/elif walk per filter, and the per-condition
+        masks are collected as ndarrays and combined with one
+        logical_and.reduce at the end; chaining `mask &=` instead
+        re-reads and re-writes the full-length mask once per filter.
+        """
+        parts = []
 
-            if column not in df.columns:
+        for filter_cond in filters:
+            if filter_cond.column not in df.columns:
+                continue
+            if filter_cond.operator == "between" and filter_cond.value2 is None:
                 continue
+            op = _FILTER_OPS.get(filter_cond.operator)
+            if op is None:
+                continue
+
+            part = op(df[filter_cond.column], filter_cond.value, filter_cond.value2)
+            if isinstance(part, pd.Series):
+                # Comparisons on nullable (Arrow-backed) columns yield NA
+                # where the value is null; a null never matches a filter
+                part = part.fillna(False).to_numpy(dtype=bool)
+            parts.append(part)
 
-            if operator == "eq":
-                mask &= df[column] == value
-            elif operator == "ne":
-                mask &= df[column] != value
-            elif operator == "gt":
-                mask &= df[column] > value
-            elif operator == "lt":
-                mask &= df[column] < value
-            elif operator == "gte":
-                mask &= df[column] >= value
-            elif operator == "lte":
-                mask &= df[column] <= value
-            elif operator == "contains":
-                mask &= df[column].astype(str).str.contains(str(value), case=False, na=False)
-            elif operator == "in":
-                mask &= df[column].isin(value if isinstance(value, list) else [value])
-            elif operator == "between" and filter_cond.value2 is not None:
-                mask &= (df[column] >= value) & (df[column] <= filter_cond.value2)
-
-        return df[mask]
+        if not parts:
+            return np.ones(len(df), dtype=bool)
+        return np.logical_and.reduce(parts)
 
     def get_columns(self) -> list[ColumnInfo]:
         """Return column information"""
@@ -110,18 +206,37 @@ class DataSource(ABC):
 
         columns = []
         for col in self._df.columns:
-            dtype_str = str(self._df[col].dtype)
-            nullable = bool(self._df[col].isna().any())
-            unique_count = int(self._df[col].nunique())
-
-            # Get sample values (up to 5 unique values)
-            sample_values = self._df[col].dropna().unique()[:5].tolist()
+            data = self._df[col]
+
+            if isinstance(data.dtype, pd.CategoricalDtype):
+                # Dictionary-encoded columns answer from metadata: the
+                # categories index is the unique values, no scan needed
+                uniques = data.cat.categories
+                nullable = bool(data.isna().any())
+                unique_count = len(uniques)
+                sample_values = uniques[:5].tolist()
+            elif isinstance(data.dtype, pd.ArrowDtype):
+                # Arrow-backed columns: the null count is buffer metadata
+                # (no scan) and one SIMD-hashed unique pass covers both
+                # the count and the samples
+                arr = pa.array(data)
+                nullable = arr.null_count > 0
+                uniques = arr.unique().drop_null()
+                unique_count = len(uniques)
+                sample_values = uniques.slice(0, 5).to_pylist()
+            else:
+                # One hash pass supplies both the count and the samples,
+                # instead of separate nunique() and unique() scans
+                uniques = data.dropna().unique()
+                nullable = bool(data.isna().any())
+                unique_count = len(uniques)
+                sample_values = uniques[:5].tolist()
 
             columns.append(ColumnInfo(
                 name=col,
-                dtype=dtype_str,
+                dtype=str(data.dtype),
                 nullable=nullable,
-                unique_count=unique_count,
+                unique_count=int(unique_count),
                 sample_values=sample_values
             ))
 
@@ -142,7 +257,9 @@ class DataSource(ABC):
         if column not in self._df.columns:
             raise ValueError(f"Column '{column}' not found")
 
-        unique_vals = self._df[column].dropna().unique()[:limit]
+        # pd.unique on the raw values skips the Series machinery and is
+        # noticeably faster on large columns
+        unique_vals = pd.unique(self._df[column].dropna().values)[:limit]
         return unique_vals.tolist()
 
     def get_data_types(self) -> dict[str, str]:
@@ -151,19 +268,24 @@ class DataSource(ABC):
             self._df = self.load_data()
 
         types = {}
-        for col in self._df.columns:
-            dtype = self._df[col].dtype
-
-            if pd.api.types.is_numeric_dtype(dtype):
+        for col, dtype in self._df.dtypes.items():
+            if dtype.kind in 'biufc':
                 types[col] = "numeric"
-            elif pd.api.types.is_datetime64_any_dtype(dtype):
+            elif dtype.kind == 'M':
                 types[col] = "datetime"
             else:
-                # Check if it could be converted to datetime
-                try:
-                    pd.to_datetime(self._df[col].dropna().head(100))
+                # Screen with the same cheap regex sniff the CSV loader
+                # uses, then coerce the sample and measure the hit rate;
+                # no exception-driven control flow and an explicit 90%
+                # threshold instead of all-or-nothing parsing
+                sample = self._df[col].dropna().head(100).astype(str)
+                if sample.empty:
+                    types[col] = "categorical"
+                elif _sniff_datetime_format(sample) is not None:
+                    types[col] = "datetime_candidate"
+                elif pd.to_datetime(sample, errors='coerce').notna().mean() > 0.9:
                     types[col] = "datetime_candidate"
-                except:
+                else:
                     types[col] = "categorical"
 
         return types
@@ -175,6 +297,25 @@ class DataSource(ABC):
         return len(self._df)
 
 
+def _sniff_datetime_format(sample: pd.Series) -> Optional[str]:
+    """
+    Detect a datetime format from a small head sample of string values.
+
+    Returns a format string for pd.to_datetime's C fast path, or None if
+    fewer than 90% of the sampled values look like dates — so plainly
+    non-date columns are rejected after ~50 short regex matches instead
+    of a full-column parse attempt.
+    """
+    if sample.empty:
+        return None
+    values = sample.astype(str)
+    if values.str.match(r'\d{4}-\d{2}-\d{2}').mean() >= 0.9:
+        return 'ISO8601'
+    if values.str.match(r'\d{1,2}/\d{1,2}/\d{4}$').mean() >= 0.9:
+        return '%m/%d/%Y'
+    return None
+
+
 class CSVDataSource(DataSource):
     """CSV file data source"""
 
@@ -185,18 +326,79 @@ class CSVDataSource(DataSource):
     def load_data(self) -> pd.DataFrame:
         """Load data from CSV file"""
         try:
-            # Read CSV file
-            df = pd.read_csv(self.file_path)
-
-            # Auto-detect and convert datetime columns
+            # A Parquet sidecar from an earlier load skips the whole
+            # parse-and-infer pipeline: it is column-compressed on disk,
+            # memory-maps on open, and already carries the datetime,
+            # category and downcast dtypes worked out below
+            parquet_path = self.file_path.with_suffix('.parquet')
+            if (parquet_path.exists()
+                    and parquet_path.stat().st_mtime >= self.file_path.stat().st_mtime):
+                try:
+                    return pd.read_parquet(parquet_path, memory_map=True)
+                except Exception:
+                    pass  # stale or corrupt sidecar; fall through to CSV
+
+            # Arrow engine tokenizes in parallel across cores and backs
+            # string columns with Arrow buffers instead of object arrays;
+            # fall back to the default parser for files it rejects
+            # (e.g. malformed rows the C engine tolerates)
+            try:
+                df = pd.read_csv(self.file_path, engine='pyarrow',
+                                 dtype_backend='pyarrow')
+            except Exception:
+                # Chunked so the parser's working set stays bounded even
+                # for files near the upload size limit; the chunks share
+                # a continuing index, so concat restores the plain frame
+                pieces = list(pd.read_csv(self.file_path, chunksize=200_000))
+                if len(pieces) > 1:
+                    df = pd.concat(pieces)
+                elif pieces:
+                    df = pieces[0]
+                else:
+                    df = pd.read_csv(self.file_path)
+
+            # Auto-detect and convert datetime columns: sniff a head
+            # sample first so non-date string columns never pay a
+            # full-column parse attempt, and convert with an explicit
+            # format so matching columns take pandas' C fast path
+            for col in df.columns:
+                if pd.api.types.is_string_dtype(df[col].dtype) or df[col].dtype == object:
+                    fmt = _sniff_datetime_format(df[col].dropna().head(50))
+                    if fmt is not None:
+                        df[col] = pd.to_datetime(df[col], format=fmt,
+                                                 errors='coerce', cache=True)
+
+            # Dictionary-encode low-cardinality string columns: category
+            # dtype stores each distinct value once and filters, grouping
+            # and value counts then compare small integer codes instead
+            # of hashing strings per row
+            n_rows = len(df)
             for col in df.columns:
-                if df[col].dtype == 'object':
-                    try:
-                        # Try to convert to datetime
-                        df[col] = pd.to_datetime(df[col])
-                    except:
-                        # If conversion fails, keep as string
-                        pass
+                if pd.api.types.is_string_dtype(df[col].dtype) or df[col].dtype == object:
+                    n_unique = df[col].nunique()
+                    if n_unique < 10000 and n_unique < n_rows * 0.5:
+                        df[col] = df[col].astype('category')
+
+            # Downcast numeric columns where lossless; every downstream
+            # pass (correlation, summary, charts) then streams through
+            # half the bytes
+            for col in df.select_dtypes(include=['int64']).columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            for col in df.select_dtypes(include=['float64']).columns:
+                # pd.to_numeric's float downcast is tolerance-based, so
+                # only take float32 when it round-trips exactly (in the
+                # column's own dtype, which may be Arrow-backed)
+                narrowed = df[col].astype(np.float32)
+                if narrowed.astype(df[col].dtype).equals(df[col]):
+                    df[col] = narrowed
+
+            # Persist the fully-typed frame so the next process restart
+            # reloads it directly; best-effort, the CSV stays the source
+            # of truth if the write fails
+            try:
+                df.to_parquet(parquet_path, compression='zstd')
+            except Exception:
+                pass
 
             return df
         except Exception as e:
@@ -258,31 +460,46 @@ if HAS_SQL_SERVER_SUPPORT:
             except Exception as e:
                 raise ValueError(f"Error loading data from SQL Server: {str(e)}")
 
-        def get_data(self, filters: Optional[list[FilterCondition]] = None,
-                     limit: Optional[int] = None, offset: int = 0,
-                     columns: Optional[list[str]] = None) -> pd.DataFrame:
+        def _fetch_data(self, filters: Optional[list[FilterCondition]] = None,
+                        limit: Optional[int] = None, offset: int = 0,
+                        columns: Optional[list[str]] = None,
+                        with_total: bool = False):
             """
             Override to support server-side filtering for better performance
             """
             try:
                 engine = self._get_engine()
 
-                # Build query
-                select_cols = ", ".join(columns) if columns else "*"
-                query = f"SELECT {select_cols} FROM {self.table_name}"
-
-                # Add WHERE clause for filters
+                # Build query; the windowed count rides along in the same
+                # round trip instead of a second COUNT(*) query
+                quote = engine.dialect.identifier_preparer.quote
+                select_cols = ", ".join(quote(c) for c in columns) if columns else "*"
+                if with_total:
+                    select_cols += ", COUNT(*) OVER () AS _total"
+                query = f"SELECT {select_cols} FROM {quote(self.table_name)}"
+
+                # Filter values go in as bound parameters: the server
+                # caches one plan per query shape instead of recompiling
+                # per distinct literal, and the driver handles typing
+                # and quoting
+                params: dict[str, Any] = {}
                 if filters:
                     where_clauses = []
-                    for f in filters:
+                    for i, f in enumerate(filters):
+                        name = f"p{i}"
+                        col = quote(f.column)
                         if f.operator == "eq":
-                            where_clauses.append(f"{f.column} = '{f.value}'")
+                            where_clauses.append(f"{col} = :{name}")
+                            params[name] = f.value
                         elif f.operator == "gt":
-                            where_clauses.append(f"{f.column} > {f.value}")
+                            where_clauses.append(f"{col} > :{name}")
+                            params[name] = f.value
                         elif f.operator == "lt":
-                            where_clauses.append(f"{f.column} < {f.value}")
+                            where_clauses.append(f"{col} < :{name}")
+                            params[name] = f.value
                         elif f.operator == "contains":
-                            where_clauses.append(f"{f.column} LIKE '%{f.value}%'")
+                            where_clauses.append(f"{col} LIKE :{name}")
+                            params[name] = f"%{f.value}%"
                         # Add more operators as needed
 
                     if where_clauses:
@@ -290,15 +507,41 @@ if HAS_SQL_SERVER_SUPPORT:
 
                 # Add pagination
                 if limit is not None:
-                    query += f" ORDER BY (SELECT NULL) OFFSET {offset} ROWS FETCH NEXT {limit} ROWS ONLY"
+                    query += " ORDER BY (SELECT NULL) OFFSET :_offset ROWS FETCH NEXT :_limit ROWS ONLY"
+                    params["_offset"] = offset
+                    params["_limit"] = limit
 
                 with engine.connect() as conn:
-                    df = pd.read_sql(text(query), conn)
+                    df = pd.read_sql(text(query), conn, params=params)
 
+                if with_total:
+                    total = int(df['_total'].iloc[0]) if len(df) else 0
+                    return df.drop(columns=['_total']), total
                 return df
             except Exception as e:
                 # Fallback to parent implementation
-                return super().get_data(filters, limit, offset, columns)
+                return super()._fetch_data(filters, limit, offset, columns, with_total)
+
+        def get_unique_values(self, column: str, limit: int = 100) -> list[Any]:
+            """
+            Get unique values for a column, computed server-side.
+
+            DISTINCT TOP(n) lets the database answer from an index and
+            ships at most `limit` values instead of the whole column.
+            """
+            try:
+                engine = self._get_engine()
+                quote = engine.dialect.identifier_preparer.quote
+                query = text(
+                    f"SELECT DISTINCT TOP(:n) {quote(column)} "
+                    f"FROM {quote(self.table_name)} "
+                    f"WHERE {quote(column)} IS NOT NULL"
+                )
+                with engine.connect() as conn:
+                    return conn.execute(query, {"n": limit}).scalars().all()
+            except Exception:
+                # Fallback to parent implementation
+                return super().get_unique_values(column, limit)
 else:
     # Placeholder when SQL Server support is not available
     SQLServerDataSource = None